@@ -1,5 +1,5 @@
 """tidal_wave is a module that retrieves data from TIDAL API and writes it to disk."""
 
-from .main import app
+from .main import cli
 
-app()
+cli()
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import contextlib
-import json
 import logging
 import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import orjson
+
 if TYPE_CHECKING:
     from io import TextIOWrapper
     from pathlib import Path
@@ -30,7 +31,7 @@ from .requesting import (
     request_albums_items,
 )
 from .track import Track
-from .utils import IMAGE_URL, download_cover_image
+from .utils import IMAGE_URL, download_cover_image, map_concurrently
 
 logger = logging.getLogger("__name__")
 
@@ -57,6 +58,7 @@ class Album:
         """
         self.album_dir: Path | None = None
         self.album_cover_saved: bool = False
+        self.cover_bytes: bytes | None = None
 
     def set_tracks(self, session: Session) -> None:
         """Populate the `tracks` attribute of `self`.
@@ -139,7 +141,7 @@ class Album:
             transparent=self.transparent,
         )
         if self.album_credits is not None:
-            num_credit: int = len(self.album_credits.credit)
+            num_credit: int = len(self.album_credits.credits)
             if num_credit == 0:
                 _msg: str = (
                     "No album credits returned from TIDAL API "
@@ -148,8 +150,7 @@ class Album:
                 logger.warning(_msg)
             else:
                 ac_file: Path = (self.album_dir / "AlbumCredits.json").absolute()
-                with ac_file.open("w") as fp:
-                    json.dump(obj=self.album_credits.credit, fp=fp)
+                ac_file.write_bytes(orjson.dumps(self.album_credits.credits))
 
     def set_album_dir(self, out_dir: Path) -> None:
         """Populate the attribute `album_dir` of `self`.
@@ -185,19 +186,26 @@ class Album:
         """Write a file named cover.jpg in self.album_dir.
 
         This is achieved via the utils.download_cover_image() function.
-        If successful, then self.album_cover_saved is set to True.
+        If successful, then self.album_cover_saved is set to True, and
+        self.cover_bytes holds the image, to be embedded into each track.
         """
         if self.album_dir is None:
             self.set_album_dir(out_dir=out_dir)
         if not self.cover_path.exists():
-            download_cover_image(
-                session=session,
-                cover_uuid=self.metadata.cover,
-                output_dir=self.album_dir,
+            self.album_cover_saved = (
+                download_cover_image(
+                    session=session,
+                    cover_uuid=self.metadata.cover,
+                    output_dir=self.album_dir,
+                )
+                is not None
             )
         else:
             self.album_cover_saved = True
 
+        if self.album_cover_saved:
+            self.cover_bytes = self.cover_path.read_bytes() or None
+
     def original_album_cover(self, session: Session) -> None:
         """Write to disk the "original" album cover of a TIDAL album.
 
@@ -235,35 +243,52 @@ class Album:
         out_dir: Path,
         *,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ) -> list[str | None]:
         """Call track.Track.get() for each track object in self.tracks.
 
-        The result of each of these calls populates self.track_files.
+        Up to `concurrency` tracks are retrieved at once, starting each one
+        `delay_ms` milliseconds after the last. The result of each of these
+        calls populates self.track_files, in album order.
         """
-        track_files: list[str | None] = [None] * self.metadata.number_of_tracks
-        for i, t in enumerate(self.tracks):  # type(t) is TracksEndpointResponseJSON
+
+        def get_track(t: TracksEndpointResponseJSON) -> dict[int, str | None]:
             track: Track = Track(track_id=t.id, transparent=self.transparent)
+            # One track failing must not discard the rest of the album,
+            # which are being retrieved alongside it
+            try:
+                track_files_value: str | None = track.get(
+                    session=session,
+                    audio_format=audio_format,
+                    out_dir=out_dir,
+                    metadata=t,
+                    album=self.metadata,
+                    no_extra_files=no_extra_files,
+                    origin_jpg=False,
+                    cover_bytes=self.cover_bytes,
+                )
+            except Exception:
+                _msg: str = f"Could not retrieve track {t.id} of album {self.album_id}"
+                logger.exception(_msg)
+                track_files_value = None
+            return {t.track_number: track_files_value}
 
-            track_files_value: str | None = track.get(
-                session=session,
-                audio_format=audio_format,
-                out_dir=out_dir,
-                metadata=t,
-                album=self.metadata,
-                no_extra_files=no_extra_files,
-                origin_jpg=False,
-            )
-            track_files[i] = {track.metadata.track_number: track_files_value}
+        track_files: list[str | None] = [None] * self.metadata.number_of_tracks
+        for i, track_file in enumerate(
+            map_concurrently(get_track, self.tracks, concurrency, delay_ms)
+        ):
+            track_files[i] = track_file
 
         self.track_files = track_files
 
     def dumps(self) -> str:
         """Return a JSON-like string representation of self.track_files."""
-        return json.dumps(self.track_files)
+        return orjson.dumps(self.track_files, option=orjson.OPT_NON_STR_KEYS).decode()
 
     def dump(self, fp: TextIOWrapper = sys.stdout) -> None:
         """Write to `fp` (by default, STDOUT) a JSON-like string of self.track_files."""
-        json.dump(self.track_files, fp)
+        fp.write(self.dumps())
 
     def get(
         self,
@@ -273,6 +298,8 @@ class Album:
         metadata: AlbumsEndpointResponseJSON | None = None,
         *,
         no_extra_files: bool = False,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ) -> None:
         """Execute other methods of self in sequence.
 
@@ -305,7 +332,14 @@ class Album:
             )
             logger.warning(_msg)
 
-        self.get_tracks(session, audio_format, out_dir, no_extra_files=no_extra_files)
+        self.get_tracks(
+            session,
+            audio_format,
+            out_dir,
+            no_extra_files=no_extra_files,
+            concurrency=concurrency,
+            delay_ms=delay_ms,
+        )
 
         if not no_extra_files:
             self.set_album_review(session)
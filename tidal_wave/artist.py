@@ -13,7 +13,7 @@ from .requesting import (
     request_artists_audio_works,
     request_artists_videos,
 )
-from .utils import download_cover_image
+from .utils import download_cover_image, map_concurrently
 from .video import Video
 
 if TYPE_CHECKING:
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
 
     from .media import AudioFormat
     from .models import (
+        AlbumsEndpointResponseJSON,
         ArtistsAlbumsResponseJSON,
         ArtistsEndpointResponseJSON,
         ArtistsVideosResponseJSON,
@@ -127,11 +128,14 @@ class Artist:
         *,
         include_eps_singles: bool,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ) -> list[str | None]:
         """First, fetch all of the albums for `self.artist_id`.
 
         Then, each of the albums (and, optionally, EPs and singles) is requested and
-        written to subdirectories of out_dir.
+        written to subdirectories of out_dir, up to `concurrency` albums at a time,
+        starting each one `delay_ms` milliseconds after the last.
         """
         if include_eps_singles:
             self.set_audio_works(session)
@@ -148,9 +152,11 @@ class Artist:
             )
         logger.info(_msg)
 
-        for a in self.albums.items:
-            album: Album = Album(album_id=a.id)
-            album.get(
+        def get_album(a: AlbumsEndpointResponseJSON) -> None:
+            # The albums are retrieved concurrently, so each album's tracks are not
+            # also fetched concurrently: concurrency is left at 1 to bound the
+            # total number of threads
+            Album(album_id=a.id).get(
                 session=session,
                 audio_format=audio_format,
                 out_dir=out_dir,
@@ -158,6 +164,8 @@ class Artist:
                 no_extra_files=no_extra_files,
             )
 
+        map_concurrently(get_album, self.albums.items, concurrency, delay_ms)
+
     def get_videos(
         self,
         session: Session,
@@ -190,6 +198,8 @@ class Artist:
         *,
         include_eps_singles: bool,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ) -> None:
         """Execute other methods in sequence.
 
@@ -212,6 +222,8 @@ class Artist:
                 out_dir,
                 include_eps_singles=True,
                 no_extra_files=no_extra_files,
+                concurrency=concurrency,
+                delay_ms=delay_ms,
             )
         self.get_albums(
             session,
@@ -219,6 +231,8 @@ class Artist:
             out_dir,
             include_eps_singles=False,
             no_extra_files=no_extra_files,
+            concurrency=concurrency,
+            delay_ms=delay_ms,
         )
 
         if not no_extra_files:
@@ -3,44 +3,75 @@
 from __future__ import annotations
 
 import base64
-import json
 import logging
+import os
 import sys
 from enum import Enum
 from typing import TYPE_CHECKING
 
+import orjson
 import requests
-import typer
+from cachecontrol import CacheControlAdapter
+from cachecontrol.caches.file_cache import FileCache
+from platformdirs import user_cache_path
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 
+from .media import AudioFormat
 from .models import BearerAuth, SessionsEndpointResponseJSON
 from .oauth import (
+    PROJECT_NAME,
     TOKEN_DIR_PATH,
     BearerToken,
     TidalOauth,
     TokenError,
+    write_token_file,
 )
+from .requesting import TidalAPIHeuristic
 from .utils import TIDAL_API_URL
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from typing import Callable
 
 
 COMMON_HEADERS: dict[str, str] = {"Accept-Encoding": "gzip, deflate, br"}
+_FIRE_TV_HEADERS: dict[str, str] = {"User-Agent": "TIDAL_ANDROID/2.38.0"}
+_ANDROID_HEADERS: dict[str, str] = {"User-Agent": "TIDAL_ANDROID/1136 okhttp 4.3.0"}
+_WINDOWS_HEADERS: dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) TIDAL/2.36.2 Chrome/116.0.5845.228 Electron/26.6.1 Safari/537.36"
+    ),
+    "Origin": "https://desktop.tidal.com/",
+    "Referer": "https://desktop.tidal.com/",
+}
+_MACOS_HEADERS: dict[str, str] = {
+    "User-Agent": "TIDALPlayer/3.1.4.209 CFNetwork/1494.0.7 Darwin/23.4.0",
+    "x-tidal-client-version": "2024.3.14",
+    "Origin": "https://desktop.tidal.com/",
+    "Referer": "https://desktop.tidal.com/",
+}
 COUNTRY_CODE_PROPER_LENGTH: int = 2
+_SESSIONS_URL: str = f"{TIDAL_API_URL}/sessions"
+HTTP_CACHE_DIR_PATH: Path = user_cache_path() / PROJECT_NAME / "http"
+HTTP_CACHE_HOURS: int = 1
+_CACHED_API_PREFIXES: tuple[str, ...] = tuple(
+    f"{TIDAL_API_URL}/{endpoint}/" for endpoint in ("albums", "artists", "tracks")
+)
+HTTP_POOL_CONNECTIONS: int = 32
+HTTP_POOL_MAXSIZE: int = 64
+# N.b. HTTP 500 is deliberately not retried: XMLDASHManifest.build_urls()
+# relies on a 500 response to a HEAD request to find a track's last segment
+HTTP_RETRY: Retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    raise_on_status=False,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class AudioFormat(str, Enum):
-    """A simple representation of TIDAL's music quality levels."""
-
-    dolby_atmos = "Atmos"
-    hi_res = "HiRes"
-    lossless = "Lossless"
-    high = "High"
-    low = "Low"
-
-
 class LogLevel(str, Enum):
     """A simple representation of logging library's verbosity levels."""
 
@@ -51,24 +82,31 @@ class LogLevel(str, Enum):
     critical = "CRITICAL"  # 50
 
 
+_FIRE_TV_FORMATS: frozenset[AudioFormat] = frozenset(
+    {
+        AudioFormat.dolby_atmos,
+        AudioFormat.lossless,
+        AudioFormat.high,
+        AudioFormat.low,
+    },
+)
+_HIGH_QUALITY_FORMATS: frozenset[AudioFormat] = frozenset({AudioFormat.hi_res})
+
+
 def load_token_from_disk(
     token_path: Path = TOKEN_DIR_PATH / "android-tidal.token",
 ) -> dict | None:
     """Attempt to read `token_path` from disk and decode its contents as JSON."""
-    if not token_path.exists():
-        _msg: str = f"FileNotFoundError: {token_path.absolute()}"
-        logger.warning(_msg)
+    try:
+        token_file_contents: bytes = token_path.read_bytes()
+    except FileNotFoundError:
+        logger.warning("FileNotFoundError: %s", token_path)
         return None
-    token_file_contents: str = token_path.read_bytes()
-    decoded_token_file_contents: str = base64.b64decode(token_file_contents).decode(
-        "utf-8",
-    )
 
     try:
-        bearer_token_json: dict = json.loads(decoded_token_file_contents)
-    except json.decoder.JSONDecodeError:
-        _msg: str = f"File '{token_path.absolute()}' cannot be parsed as JSON"
-        logger.warning(_msg)
+        bearer_token_json: dict = orjson.loads(base64.b64decode(token_file_contents))
+    except orjson.JSONDecodeError:
+        logger.warning("File '%s' cannot be parsed as JSON", token_path)
         return None
     else:
         return bearer_token_json
@@ -80,41 +118,57 @@ def validate_token_for_session(
 ) -> requests.Session | None:
     """Send a GET request to the /sessions endpoint of TIDAL's API.
 
+    The request is sent through the requests.Session object that is
+    returned, so that its connection is reused by subsequent API calls;
+    the session caches responses, on disk for public TIDAL catalog
+    responses, and pools up to HTTP_POOL_MAXSIZE connections per host.
     If `token` is valid, use the SessionsEndpointResponseJSON object
-    that was returned from the API to create a requests.Session object with
-    some additional attributes. Otherwise, return None
+    that was returned from the API to set some additional attributes on
+    the session. Otherwise, close the session and return None
     """
-    auth_headers: dict[str, str] = {**headers, "Authorization": f"Bearer {token}"}
-    sess: requests.Session | None = None
-
-    with requests.get(
-        url=f"{TIDAL_API_URL}/sessions",
-        headers=auth_headers,
-        timeout=10,
-    ) as r:
+    sess: requests.Session = requests.Session()
+    sess.headers = CaseInsensitiveDict(headers)
+    sess.auth = BearerAuth(token=token)
+    adapter = CacheControlAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=HTTP_RETRY,
+    )
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    # Public TIDAL catalog responses are persisted on disk between runs of
+    # tidal-wave; all other responses only ever go to the in-memory cache
+    api_adapter = CacheControlAdapter(
+        cache=FileCache(HTTP_CACHE_DIR_PATH),
+        heuristic=TidalAPIHeuristic(hours=HTTP_CACHE_HOURS),
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=HTTP_RETRY,
+    )
+    for prefix in _CACHED_API_PREFIXES:
+        sess.mount(prefix, api_adapter)
+
+    with sess.get(url=_SESSIONS_URL, timeout=10) as r:
         try:
             r.raise_for_status()
         except requests.HTTPError:
             if r.status_code == 401:
                 logger.exception("Token is not authorized")
-                return sess
-            logger.exception("Error occurred when attempting GET request")
-            return sess
+            else:
+                logger.exception("Error occurred when attempting GET request")
+            sess.close()
+            return None
 
-        serj = SessionsEndpointResponseJSON.from_dict(r.json())
+        serj = SessionsEndpointResponseJSON.from_dict(orjson.loads(r.content))
         logger.debug("Adding data from API reponse to session object:")
         logger.debug(serj)
 
-    sess: requests.Session = requests.Session()
-    sess.headers = headers
-    sess.auth = BearerAuth(token=token)
     sess.user_id = serj.user_id
     sess.session_id = serj.session_id
     sess.client_id = serj.client.id
     sess.client_name = serj.client.name
     if serj.country_code == "US":
-        sess.params["countryCode"] = "US"
-        sess.params["locale"] = "en_US"
+        sess.params.update({"countryCode": "US", "locale": "en_US"})
         sess.headers["Accept-Language"] = "en-US"
     elif (len(serj.country_code) == COUNTRY_CODE_PROPER_LENGTH) and (
         serj.country_code.isupper()
@@ -123,6 +177,28 @@ def validate_token_for_session(
     return sess
 
 
+def _persist_token(
+    s: requests.Session,
+    token_path: Path,
+    extra: dict | None = None,
+) -> None:
+    """Write the access token and session attributes of `s` to `token_path`.
+
+    The data is written as base64-encoded JSON, along with the contents of
+    `extra`, for load_token_from_disk() to read on the next login.
+    """
+    to_write: dict = {
+        "access_token": s.auth.token,
+        "session_id": s.session_id,
+        "client_id": s.client_id,
+        "client_name": s.client_name,
+        "country_code": s.params["countryCode"],
+        **(extra or {}),
+    }
+    logger.debug("Writing this access token to '%s'", token_path)
+    write_token_file(token_path, base64.b64encode(orjson.dumps(to_write)))
+
+
 def login_fire_tv(
     token_path: Path = TOKEN_DIR_PATH / "fire_tv-tidal.token",
 ) -> requests.Session | None:
@@ -131,13 +207,13 @@ def login_fire_tv(
     If successful, return a requests.Session object with
     extra attributes set, particular to the emulated client, Fire TV.
     """
+    # The token is only written to disk when it is newly minted or refreshed
     bearer_token = BearerToken.load(p=token_path)
     if bearer_token is not None:
-        bearer_token.save(p=token_path)
+        logger.info("Successfully loaded token from disk.")
     else:
         to = TidalOauth()
         bearer_token = to.authorization_code_flow()
-        logger.info("Successfully loaded token from disk.")
         bearer_token.save(p=token_path)
 
     # check if access needs refreshed
@@ -149,14 +225,14 @@ def login_fire_tv(
             sys.exit(te.args[0])
         else:
             logger.info("Successfully refreshed TIDAL access token")
+            bearer_token.save(p=token_path)
 
     s: requests.Session | None = validate_token_for_session(bearer_token.access_token)
     if s is None:
         logger.critical("Access token is not valid: exiting now.")
     else:
         s.params["deviceType"] = "TV"
-        s.headers["User-Agent"] = "TIDAL_ANDROID/2.38.0"
-        bearer_token.save()
+        s.headers.update(_FIRE_TV_HEADERS)
     return s
 
 
@@ -169,13 +245,14 @@ def login_android(
     extra attributes set, particular to the emulated client, Android
     phone or tablet.
     """
-    _msg: str = f"Loading TIDAL access token from '{token_path.absolute()}'"
-    logger.info(_msg)
+    logger.info("Loading TIDAL access token from '%s'", token_path)
     _token: dict | None = load_token_from_disk(token_path=token_path)
     access_token: str | None = None if _token is None else _token.get("access_token")
     device_type: str | None = None if _token is None else _token.get("device_type")
 
     if access_token is None:
+        import typer
+
         logger.warning("Could not load access token from disk")
         access_token: str = typer.prompt(
             "Enter TIDAL access token from an Android (the part after 'Bearer ')",
@@ -191,27 +268,16 @@ def login_android(
     s: requests.Session | None = validate_token_for_session(access_token)
     if s is None:
         logger.critical("Access token is not valid: exiting now.")
-        if token_path.exists():
-            token_path.unlink()
+        token_path.unlink(missing_ok=True)
     else:
-        _msg: str = f"Access token is valid: saving to '{token_path.absolute()}'"
-        logger.info(_msg)
-        if device_type is not None:
-            s.params["deviceType"] = device_type
-
-        s.params["platform"] = "ANDROID"
-        s.headers["User-Agent"] = "TIDAL_ANDROID/1136 okhttp 4.3.0"
-        to_write: dict = {
-            "access_token": s.auth.token,
-            "session_id": s.session_id,
-            "client_id": s.client_id,
-            "client_name": s.client_name,
-            "country_code": s.params["countryCode"],
-            "device_type": device_type,
-        }
-        _msg: str = f"Writing this bearer token to '{token_path.absolute()}'"
-        logger.debug(_msg)
-        token_path.write_bytes(base64.b64encode(bytes(json.dumps(to_write), "UTF-8")))
+        logger.info("Access token is valid: saving to '%s'", token_path)
+        s.params.update(
+            {"platform": "ANDROID"}
+            if device_type is None
+            else {"deviceType": device_type, "platform": "ANDROID"},
+        )
+        s.headers.update(_ANDROID_HEADERS)
+        _persist_token(s, token_path, extra={"device_type": device_type})
     return s
 
 
@@ -227,6 +293,8 @@ def login_windows(
     _token: dict | None = load_token_from_disk(token_path=token_path)
     access_token: str | None = None if _token is None else _token.get("access_token")
     if access_token is None:
+        import typer
+
         access_token: str = typer.prompt(
             "Enter TIDAL API access token (the part after 'Bearer ')",
         )
@@ -234,24 +302,11 @@ def login_windows(
     s: requests.Session | None = validate_token_for_session(access_token)
     if s is None:
         logger.critical("Access token is not valid: exiting now.")
-        if token_path.exists():
-            token_path.unlink()
+        token_path.unlink(missing_ok=True)
     else:
-        _msg: str = f"Writing this access token to '{token_path.absolute()}'"
-        logger.debug(_msg)
-        s.headers["User-Agent"] = (
-            "Mozilla/5.0 (Windows NT 10.0; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) TIDAL/2.36.2 Chrome/116.0.5845.228 Electron/26.6.1 Safari/537.36"
-        )
-        s.headers["Origin"] = s.headers["Referer"] = "https://desktop.tidal.com/"
+        s.headers.update(_WINDOWS_HEADERS)
         s.params["deviceType"] = "DESKTOP"
-        to_write: dict = {
-            "access_token": s.auth.token,
-            "session_id": s.session_id,
-            "client_id": s.client_id,
-            "client_name": s.client_name,
-            "country_code": s.params["countryCode"],
-        }
-        token_path.write_bytes(base64.b64encode(bytes(json.dumps(to_write), "UTF-8")))
+        _persist_token(s, token_path)
     return s
 
 
@@ -267,6 +322,8 @@ def login_macos(
     _token: dict | None = load_token_from_disk(token_path=token_path)
     access_token: str | None = None if _token is None else _token.get("access_token")
     if access_token is None:
+        import typer
+
         access_token: str = typer.prompt(
             "Enter TIDAL API access token (the part after 'Bearer ')",
         )
@@ -274,28 +331,58 @@ def login_macos(
     s: requests.Session | None = validate_token_for_session(access_token)
     if s is None:
         logger.critical("Access token is not valid: exiting now.")
-        if token_path.exists():
-            token_path.unlink()
+        token_path.unlink(missing_ok=True)
     else:
-        _msg: str = f"Writing this access token to '{token_path.absolute()}'"
-        logger.debug()
-        s.headers["User-Agent"] = (
-            "TIDALPlayer/3.1.4.209 CFNetwork/1494.0.7 Darwin/23.4.0"
-        )
-        s.headers["x-tidal-client-version"] = "2024.3.14"
-        s.headers["Origin"] = s.headers["Referer"] = "https://desktop.tidal.com/"
+        s.headers.update(_MACOS_HEADERS)
         s.params["deviceType"] = "DESKTOP"
-        to_write: dict = {
-            "access_token": s.auth.token,
-            "session_id": s.session_id,
-            "client_id": s.client_id,
-            "client_name": s.client_name,
-            "country_code": s.params["countryCode"],
-        }
-        token_path.write_bytes(base64.b64encode(bytes(json.dumps(to_write), "UTF-8")))
+        _persist_token(s, token_path)
     return s
 
 
+_PROMPT_CHOICES: dict[str, Callable[[], requests.Session | None]] = {
+    "android": login_android,
+    "a": login_android,
+    "macos": login_macos,
+    "m": login_macos,
+    "windows": login_windows,
+    "w": login_windows,
+}
+
+
+def login_high_quality() -> requests.Session | None:
+    """Log in with an Android-/Windows-/macOS-gleaned API token.
+
+    If a token for one of those clients is already on disk, use it;
+    otherwise, prompt the user for which client to provide a token.
+    """
+    # If there's already a token, skip the prompt and input rigmarole
+    with os.scandir(TOKEN_DIR_PATH) as it:
+        token_files: frozenset[str] = frozenset(e.name for e in it if e.is_file())
+    if "android-tidal.token" in token_files:
+        return login_android()
+    if "windows-tidal.token" in token_files:
+        return login_windows()
+    if "mac_os-tidal.token" in token_files:
+        return login_macos()
+
+    import typer
+
+    while True:
+        _input: str = typer.prompt(
+            "For which of Android [a], macOS [m], or Windows [w] would you like "
+            "to provide an API token?",
+        ).lower()
+        login_function = _PROMPT_CHOICES.get(_input)
+        if login_function is not None:
+            return login_function()
+
+
+_LOGIN_DISPATCH: dict[AudioFormat, Callable[[], requests.Session | None]] = {
+    **dict.fromkeys(_FIRE_TV_FORMATS, login_fire_tv),
+    **dict.fromkeys(_HIGH_QUALITY_FORMATS, login_high_quality),
+}
+
+
 def login(
     audio_format: AudioFormat,
 ) -> tuple[requests.Session | None, AudioFormat | str]:
@@ -307,46 +394,13 @@ def login(
     Return a tuple of a requests.Session object, if no error, and the
     AudioFormat instance passed in; or (None, "") in the event of error.
     """
-    high_quality_formats: set[AudioFormat] = {AudioFormat.hi_res}
-    fire_tv_formats: set[AudioFormat] = {
-        AudioFormat.dolby_atmos,
-        AudioFormat.lossless,
-        AudioFormat.high,
-        AudioFormat.low,
-    }
-    if audio_format in fire_tv_formats:
-        return (login_fire_tv(), audio_format)
-
-    if audio_format in high_quality_formats:
-        # If there's already a token, skip the prompt and input rigmarole
-        if (TOKEN_DIR_PATH / "android-tidal.token").exists():
-            return (login_android(), audio_format)
-        if (TOKEN_DIR_PATH / "windows-tidal.token").exists():
-            return (login_windows(), audio_format)
-        if (TOKEN_DIR_PATH / "mac_os-tidal.token").exists():
-            return (login_macos(), audio_format)
-
-        options: set = {"android", "a", "macos", "m", "windows", "w"}
-        _input: str = ""
-        while _input not in options:
-            _input = typer.prompt(
-                "For which of Android [a], macOS [m], or Windows [w] would you like "
-                "to provide an API token?",
-            ).lower()
-
-        _to_return: tuple[None, str] = (None, "")
-
-        if _input in {"android", "a"}:
-            _to_return = (login_android(), audio_format)
-        elif _input in {"macos", "m"}:
-            _to_return = (login_macos(), audio_format)
-        elif _input in {"windows", "w"}:
-            _to_return = (login_windows(), audio_format)
-        return _to_return
+    login_function = _LOGIN_DISPATCH.get(audio_format)
+    if login_function is not None:
+        return (login_function(), audio_format)
 
     _msg: str = (
         "Please provide one of the following: "
         f"{', '.join(e.value for e in AudioFormat)}"
     )
-    logger.critical()
-    return _to_return
+    logger.critical(_msg)
+    return (None, "")
@@ -2,34 +2,59 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from contextlib import closing
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import click
 import typer
-from cachecontrol import CacheControl
 from platformdirs import user_music_path
 from typing_extensions import Annotated
 
-from .album import Album
-from .artist import Artist
-from .login import AudioFormat, LogLevel, login
-from .mix import Mix
+from .login import LogLevel, login
+from .media import AudioFormat
 from .models import (
     TidalAlbum,
     TidalArtist,
     TidalMix,
     TidalPlaylist,
+    TidalResource,
     TidalTrack,
     TidalVideo,
     match_tidal_url,
 )
-from .playlist import Playlist
-from .track import Track
-from .utils import is_tidal_api_reachable
-from .video import Video
+from .utils import (
+    TIDAL_API_REQUESTS_PER_SECOND,
+    api_rate_limiter,
+    is_tidal_api_reachable,
+)
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from requests import Session
 
 __version__ = "2024.9.2"
+_LOG_LEVELS: dict[LogLevel, int] = {
+    LogLevel.debug: logging.DEBUG,
+    LogLevel.info: logging.INFO,
+    LogLevel.warning: logging.WARNING,
+    LogLevel.error: logging.ERROR,
+    LogLevel.critical: logging.CRITICAL,
+}
+
+logger = logging.getLogger(__name__)
+_LOG_HANDLER: logging.Handler = logging.StreamHandler()
+_LOG_HANDLER.setFormatter(
+    logging.Formatter(
+        fmt="%(asctime)s,%(msecs)03d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s",
+        datefmt="%Y-%m-%d:%H:%M:%S",
+    ),
+)
 
 
 # https://typer.tiangolo.com/tutorial/options/version/#fix-with-is_eager
@@ -40,31 +65,241 @@ def version_callback(value: bool) -> None:  # noqa: FBT001
         raise typer.Exit
 
 
-app = typer.Typer()
-_user_music_path: Path = user_music_path()
+def _handle_track(
+    tidal_resource: TidalTrack,
+    session: Session,
+    *,
+    audio_format: AudioFormat,
+    output_directory: Path,
+    no_extra_files: bool,
+    transparent: bool,
+    **_: object,
+) -> None:
+    """Retrieve a single track, writing it to `output_directory`."""
+    from .track import Track
+
+    track = Track(track_id=tidal_resource.tidal_id, transparent=transparent)
+    track.get(
+        session=session,
+        audio_format=audio_format,
+        out_dir=output_directory,
+        no_extra_files=no_extra_files,
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        track.dump()
+
+
+def _handle_album(
+    tidal_resource: TidalAlbum,
+    session: Session,
+    *,
+    audio_format: AudioFormat,
+    output_directory: Path,
+    no_extra_files: bool,
+    transparent: bool,
+    concurrency: int,
+    delay_ms: int,
+    **_: object,
+) -> None:
+    """Retrieve all of an album's tracks, writing them to `output_directory`."""
+    from .album import Album
+
+    album = Album(album_id=tidal_resource.tidal_id, transparent=transparent)
+    album.get(
+        session=session,
+        audio_format=audio_format,
+        out_dir=output_directory,
+        no_extra_files=no_extra_files,
+        concurrency=concurrency,
+        delay_ms=delay_ms,
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        album.dump()
+
+
+def _handle_artist(
+    tidal_resource: TidalArtist,
+    session: Session,
+    *,
+    audio_format: AudioFormat,
+    output_directory: Path,
+    include_eps_singles: bool,
+    no_extra_files: bool,
+    transparent: bool,
+    concurrency: int,
+    delay_ms: int,
+    **_: object,
+) -> None:
+    """Retrieve an artist's albums and videos, writing them to `output_directory`."""
+    from .artist import Artist
+
+    artist = Artist(artist_id=tidal_resource.tidal_id, transparent=transparent)
+    artist.get(
+        session=session,
+        audio_format=audio_format,
+        out_dir=output_directory,
+        include_eps_singles=include_eps_singles,
+        no_extra_files=no_extra_files,
+        concurrency=concurrency,
+        delay_ms=delay_ms,
+    )
+
+
+def _handle_video(
+    tidal_resource: TidalVideo,
+    session: Session,
+    *,
+    output_directory: Path,
+    transparent: bool,
+    **_: object,
+) -> None:
+    """Retrieve a single video, writing it to `output_directory`."""
+    from .video import Video
+
+    video = Video(video_id=tidal_resource.tidal_id, transparent=transparent)
+    video.get(session=session, out_dir=output_directory)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        video.dump()
+
+
+def _handle_playlist(
+    tidal_resource: TidalPlaylist,
+    session: Session,
+    *,
+    audio_format: AudioFormat,
+    output_directory: Path,
+    no_extra_files: bool,
+    no_flatten: bool,
+    transparent: bool,
+    concurrency: int,
+    delay_ms: int,
+    **_: object,
+) -> None:
+    """Retrieve a playlist's tracks and videos, writing them to `output_directory`."""
+    from .playlist import Playlist
+
+    playlist = Playlist(playlist_id=tidal_resource.tidal_id, transparent=transparent)
+    retrieve = playlist.get_elements if no_flatten else playlist.get
+    retrieve(
+        session=session,
+        audio_format=audio_format,
+        out_dir=output_directory,
+        no_extra_files=no_extra_files,
+        concurrency=concurrency,
+        delay_ms=delay_ms,
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        playlist.dump()
+
+
+def _handle_mix(
+    tidal_resource: TidalMix,
+    session: Session,
+    *,
+    audio_format: AudioFormat,
+    output_directory: Path,
+    no_extra_files: bool,
+    no_flatten: bool,
+    transparent: bool,
+    concurrency: int,
+    delay_ms: int,
+    **_: object,
+) -> None:
+    """Retrieve a mix's tracks and videos, writing them to `output_directory`."""
+    from .mix import Mix
+
+    mix = Mix(mix_id=tidal_resource.tidal_id, transparent=transparent)
+    retrieve = mix.get_elements if no_flatten else mix.get
+    retrieve(
+        session=session,
+        audio_format=audio_format,
+        out_dir=output_directory,
+        no_extra_files=no_extra_files,
+        concurrency=concurrency,
+        delay_ms=delay_ms,
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        mix.dump()
+
+
+@lru_cache(maxsize=None)
+def get_session(
+    audio_format: AudioFormat,
+) -> tuple[Session | None, AudioFormat | str]:
+    """Log in to TIDAL for `audio_format` at most once per process.
+
+    Every later call with the same `audio_format`, e.g. from main() being
+    invoked again in the same interpreter, reuses the session and its pool
+    of kept-alive connections. The session is closed when the process exits.
+    """
+    s, audio_format = login(audio_format=audio_format)
+    if s is not None:
+        atexit.register(s.close)
+    return s, audio_format
+
+
+def _read_batch_file(batch_file: Path) -> list[str]:
+    """Return the TIDAL URLs in `batch_file`, skipping blanks and comments."""
+    lines: list[str] = batch_file.read_text(encoding="utf-8").splitlines()
+    stripped = (ln.strip() for ln in lines)
+    return [ln for ln in stripped if ln and not ln.startswith("#")]
+
+
+# Map each type returned by match_tidal_url() to the function that retrieves it
+_RESOURCE_HANDLERS: dict[type, Callable[..., None]] = {
+    TidalTrack: _handle_track,
+    TidalAlbum: _handle_album,
+    TidalArtist: _handle_artist,
+    TidalVideo: _handle_video,
+    TidalPlaylist: _handle_playlist,
+    TidalMix: _handle_mix,
+}
+
+app = typer.Typer(rich_markup_mode=None)
+# Too many simultaneous downloads provoke rate limiting by TIDAL, so never
+# default to more than three, nor allow more than _MAX_CONCURRENCY
+_MAX_CONCURRENCY: int = 8
+_default_concurrency: int = min(
+    3,
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else (os.cpu_count() or 1),
+)
 
 
 @app.command()
 def main(
     tidal_url: Annotated[
-        str,
+        str | None,
         typer.Argument(
-            help="The URL to the TIDAL resource that is desired to retrieve.",
+            help=(
+                "The URL to the TIDAL resource that is desired to retrieve. "
+                "Optional if passing --batch-file"
+            ),
         ),
-    ],
+    ] = None,
     audio_format: Annotated[
         AudioFormat,
         typer.Option(case_sensitive=False),
-    ] = AudioFormat.lossless.value,
+    ] = AudioFormat.lossless,
     output_directory: Annotated[
-        Path,
+        Path | None,
         typer.Argument(
-            help="The directory under which directory(ies) of files will be written",
+            help=(
+                "The directory under which directory(ies) of files will be written. "
+                "By default, the user's music directory"
+            ),
+            show_default=False,
         ),
-    ] = _user_music_path,
+    ] = None,
     loglevel: Annotated[
         LogLevel, typer.Option(case_sensitive=False),
-    ] = LogLevel.info.value,
+    ] = LogLevel.info,
     include_eps_singles: Annotated[  # noqa: FBT002
         bool,
         typer.Option(
@@ -102,29 +337,110 @@ def main(
             help="Whether to dump JSON responses from TIDAL API; maximum verbosity",
         ),
     ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            min=1,
+            max=_MAX_CONCURRENCY,
+            clamp=True,
+            help=(
+                "How many tracks and/or videos of an album, playlist, or mix, or "
+                "albums of an artist, to retrieve at the same time"
+            ),
+        ),
+    ] = _default_concurrency,
+    delay_ms: Annotated[
+        int,
+        typer.Option(
+            "--delay-ms",
+            min=0,
+            help=(
+                "How many milliseconds to wait between starting the retrieval of "
+                "one track, video, or album and the next"
+            ),
+        ),
+    ] = 0,
+    api_rate: Annotated[
+        float,
+        typer.Option(
+            "--api-rate",
+            min=0,
+            help=(
+                "How many requests per second, at most, to send to TIDAL API across "
+                "all concurrent retrievals. 0 for no limit"
+            ),
+        ),
+    ] = TIDAL_API_REQUESTS_PER_SECOND,
+    batch_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--batch-file",
+            exists=True,
+            dir_okay=False,
+            readable=True,
+            help=(
+                "A file of TIDAL URLs, one per line, to retrieve in turn using the "
+                "same login. Blank lines and lines starting with '#' are skipped"
+            ),
+        ),
+    ] = None,
     version: Annotated[  # noqa: ARG001
         bool | None,
         typer.Option("--version", callback=version_callback, is_eager=True),
     ] = None,
 ):
     """Parse command line arguments and retrieve data from TIDAL."""
-    logging.basicConfig(
-        format="%(asctime)s,%(msecs)03d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s",
-        datefmt="%Y-%m-%d:%H:%M:%S",
-        level=logging.getLevelName(loglevel.value),
-    )
-    logger = logging.getLogger(__name__)
+    # Thread and process details are not in the log format, so don't
+    # look them up for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Leave alone any handlers already configured, e.g. when tidal_wave is
+    # used as a library, or when main() is called more than once
+    root_logger: logging.Logger = logging.getLogger()
+    if not root_logger.handlers:
+        root_logger.addHandler(_LOG_HANDLER)
+    root_logger.setLevel(_LOG_LEVELS[loglevel])
 
-    tidal_resource: (
-        TidalAlbum | TidalMix | TidalPlaylist | TidalTrack | TidalVideo | None
-    ) = match_tidal_url(tidal_url)
+    if output_directory is None:
+        output_directory = user_music_path()
 
-    if tidal_resource is None:
-        _msg: str = (
-            f"Cannot parse '{tidal_url}' as a TIDAL album, artist, mix, playlist, "
-            "track, or video URL"
-        )
-        logger.critical(_msg)
+    api_rate_limiter.configure(rate=api_rate)
+
+    tidal_urls: list[str] = [] if tidal_url is None else [tidal_url]
+    if batch_file is not None:
+        tidal_urls.extend(_read_batch_file(batch_file))
+
+    if len(tidal_urls) == 0:
+        logger.critical("Please provide a TIDAL URL, or a file of them to --batch-file")
+        raise typer.Exit(code=1)
+
+    # A batch carries on past URLs that cannot be parsed, and retrieves any
+    # resource that appears more than once in it only once
+    tidal_resources: list[TidalResource] = []
+    seen: set[tuple[type, int | str]] = set()
+    for url in tidal_urls:
+        tidal_resource: TidalResource | None = match_tidal_url(url)
+        if tidal_resource is None:
+            _msg: str = (
+                f"Cannot parse '{url}' as a TIDAL album, artist, mix, playlist, "
+                "track, or video URL"
+            )
+            logger.critical(_msg)
+            if batch_file is None:
+                raise typer.Exit(code=1)
+            continue
+
+        key: tuple[type, int | str] = (type(tidal_resource), tidal_resource.tidal_id)
+        if key in seen:
+            _msg: str = f"Skipping '{url}', as it has already been retrieved"
+            logger.info(_msg)
+            continue
+        seen.add(key)
+        tidal_resources.append(tidal_resource)
+
+    if len(tidal_resources) == 0:
         raise typer.Exit(code=1)
 
     # Check Internet connectivity, and whether api.tidal.com is up
@@ -136,97 +452,60 @@ def main(
         if not user_wishes_to_continue:
             raise typer.Exit(code=1)
 
-    s, audio_format = login(audio_format=audio_format)
-    if s is None:
+    session, audio_format = get_session(audio_format)
+    if session is None:
         raise typer.Exit(code=1)
 
-    with closing(CacheControl(s)) as session:
-        if isinstance(tidal_resource, TidalTrack):
-            track = Track(track_id=tidal_resource.tidal_id, transparent=transparent)
-            track.get(
-                session=session,
-                audio_format=audio_format,
-                out_dir=output_directory,
-                no_extra_files=no_extra_files,
-            )
-
-            if loglevel == LogLevel.debug:
-                track.dump()
-            raise typer.Exit(code=0)
-        if isinstance(tidal_resource, TidalAlbum):
-            album = Album(album_id=tidal_resource.tidal_id, transparent=transparent)
-            album.get(
-                session=session,
-                audio_format=audio_format,
-                out_dir=output_directory,
-                no_extra_files=no_extra_files,
-            )
+    for tidal_resource in tidal_resources:
+        handler = _RESOURCE_HANDLERS.get(type(tidal_resource))
+        if handler is None:
+            raise NotImplementedError
 
-            if loglevel == LogLevel.debug:
-                album.dump()
-            raise typer.Exit(code=0)
-        if isinstance(tidal_resource, TidalArtist):
-            artist = Artist(artist_id=tidal_resource.tidal_id, transparent=transparent)
-            artist.get(
-                session=session,
+        try:
+            handler(
+                tidal_resource,
+                session,
                 audio_format=audio_format,
-                out_dir=output_directory,
+                output_directory=output_directory,
                 include_eps_singles=include_eps_singles,
                 no_extra_files=no_extra_files,
+                no_flatten=no_flatten,
+                transparent=transparent,
+                concurrency=concurrency,
+                delay_ms=delay_ms,
             )
-            raise typer.Exit(code=0)
-        if isinstance(tidal_resource, TidalVideo):
-            video = Video(video_id=tidal_resource.tidal_id, transparent=transparent)
-            video.get(session=session, out_dir=output_directory)
-
-            if loglevel == LogLevel.debug:
-                video.dump()
-            raise typer.Exit(code=0)
-        if isinstance(tidal_resource, TidalPlaylist):
-            playlist = Playlist(
-                playlist_id=tidal_resource.tidal_id, transparent=transparent,
-            )
-            if no_flatten:
-                playlist.get_elements(
-                    session=session,
-                    audio_format=audio_format,
-                    out_dir=output_directory,
-                    no_extra_files=no_extra_files,
-                )
-            else:
-                playlist.get(
-                    session=session,
-                    audio_format=audio_format,
-                    out_dir=output_directory,
-                    no_extra_files=no_extra_files,
-                )
-
-            if loglevel == LogLevel.debug:
-                playlist.dump()
-            raise typer.Exit(code=0)
-        if isinstance(tidal_resource, TidalMix):
-            mix = Mix(mix_id=tidal_resource.tidal_id, transparent=transparent)
-            if no_flatten:
-                mix.get_elements(
-                    session=session,
-                    audio_format=audio_format,
-                    out_dir=output_directory,
-                    no_extra_files=no_extra_files,
-                )
-            else:
-                mix.get(
-                    session=session,
-                    audio_format=audio_format,
-                    out_dir=output_directory,
-                    no_extra_files=no_extra_files,
-                )
-
-            if loglevel == LogLevel.debug:
-                mix.dump()
-            raise typer.Exit(code=0)
-
-        raise NotImplementedError
+        except Exception:
+            if batch_file is None:
+                raise
+            _msg: str = f"Could not retrieve '{tidal_resource.url}'"
+            logger.exception(_msg)
+    raise typer.Exit(code=0)
+
+
+def cli() -> None:
+    """Run tidal-wave from the command line.
+
+    The common invocation, `tidal-wave <URL>` with no options, calls main()
+    with its defaults directly, skipping Click's parsing of the command line;
+    every other invocation goes through the Typer app. In the former case,
+    the exceptions that Click's standalone mode would handle are handled
+    here in the same way.
+    """
+    args: list[str] = sys.argv[1:]
+    if len(args) == 1 and args[0].startswith(("http://", "https://")):
+        try:
+            main(tidal_url=args[0])
+        except typer.Exit as te:
+            sys.exit(te.exit_code)
+        except click.ClickException as ce:
+            ce.show()
+            sys.exit(ce.exit_code)
+        except (click.exceptions.Abort, EOFError, KeyboardInterrupt):
+            click.echo("Aborted!", file=sys.stderr)
+            sys.exit(1)
+    else:
+        app()
 
 
 if __name__ == "__main__":
-    app()
+    cli()
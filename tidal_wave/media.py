@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from enum import Enum
+from types import MappingProxyType
+from typing import Mapping
 
 
 class AudioFormat(str, Enum):
@@ -57,3 +60,26 @@ TAG_MAPPING: dict[str, dict[str, str]] = {
     },
     "title": {"flac": "TITLE", "m4a": "\xa9nam"},
 }
+
+# TAG_MAPPING flattened per container, so that tagging a file is one lookup per
+# tag; the tag names are interned as they are used over and over as dict keys
+TAG_MAPPING_FLAC: Mapping[str, str] = MappingProxyType(
+    {k: sys.intern(v["flac"]) for k, v in TAG_MAPPING.items() if v["flac"] is not None}
+)
+TAG_MAPPING_M4A: Mapping[str, str] = MappingProxyType(
+    {k: sys.intern(v["m4a"]) for k, v in TAG_MAPPING.items() if v["m4a"] is not None}
+)
+# The M4A tags that are freeform '----' atoms, whose values mutagen
+# expects to be bytes rather than str
+FREEFORM_TAGS_M4A: frozenset[str] = frozenset(
+    v for v in TAG_MAPPING_M4A.values() if v.startswith("----")
+)
+_TAG_MAPS: dict[str, Mapping[str, str]] = {
+    "flac": TAG_MAPPING_FLAC,
+    "m4a": TAG_MAPPING_M4A,
+}
+
+
+def get_tag_map(container: str) -> Mapping[str, str]:
+    """Return the read-only tag name mapping for `container`, 'flac' or 'm4a'."""
+    return _TAG_MAPS[container]
@@ -1,7 +1,7 @@
 """Represent a mix of tracks and/or videos in the reckoning of TIDAL API."""
 
-import json
 import logging
+import os
 import shutil
 import sys
 from dataclasses import dataclass
@@ -10,6 +10,7 @@ from types import SimpleNamespace
 from typing import Dict, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 
+import orjson
 from requests import HTTPError, Session
 
 from .media import AudioFormat
@@ -18,7 +19,14 @@ from .models import (
     VideosEndpointResponseJSON,
 )
 from .track import Track
-from .utils import TIDAL_API_URL, replace_illegal_characters
+from .utils import (
+    TIDAL_API_URL,
+    api_rate_limiter,
+    is_artist_file,
+    map_concurrently,
+    move_file,
+    replace_illegal_characters,
+)
 from .video import Video
 
 logger = logging.getLogger("__name__")
@@ -89,45 +97,66 @@ class Mix:
                 self.mix_cover_saved = True
 
     def get_items(
-        self, session: Session, audio_format: AudioFormat, no_extra_files: bool
+        self,
+        session: Session,
+        audio_format: AudioFormat,
+        no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ) -> Tuple[Optional[Union[Track, Video]]]:
         """Using either Track.get() or Video.get(), attempt to request
-        the data for each track or video in self.items."""
+        the data for each track or video in self.items, up to
+        `concurrency` at a time and `delay_ms` milliseconds apart."""
         if len(self.items) == 0:
             self.files = {}
             return
 
-        tracks_videos: List[Optional[Union[Track, Video]]] = [None] * len(self.items)
-        for i, item in enumerate(self.items):
-            if item is None:
-                tracks_videos[i] = None
-                continue
-            elif isinstance(item, TracksEndpointResponseJSON):
-                track: Track = Track(track_id=item.id, transparent=self.transparent)
-                track.get(
-                    session=session,
-                    audio_format=audio_format,
-                    out_dir=self.mix_dir,
-                    metadata=item,
-                    no_extra_files=no_extra_files,
-                    origin_jpg=False,
-                )
-                tracks_videos[i] = track
-            elif isinstance(item, VideosEndpointResponseJSON):
-                video: Video = Video(video_id=item.id, transparent=self.transparent)
-                video.get(
-                    session=session,
-                    out_dir=self.mix_dir,
-                    metadata=item,
-                )
-                tracks_videos[i] = video
-            else:
-                tracks_videos[i] = None
-                continue
-        else:
-            self.tracks_videos: Tuple[Optional[Union[Track, Video]]] = tuple(
-                tracks_videos
+        def get_track(item: TracksEndpointResponseJSON) -> Track:
+            track: Track = Track(track_id=item.id, transparent=self.transparent)
+            track.get(
+                session=session,
+                audio_format=audio_format,
+                out_dir=self.mix_dir,
+                metadata=item,
+                no_extra_files=no_extra_files,
+                origin_jpg=False,
             )
+            return track
+
+        def get_video(item: VideosEndpointResponseJSON) -> Video:
+            video: Video = Video(video_id=item.id, transparent=self.transparent)
+            video.get(
+                session=session,
+                out_dir=self.mix_dir,
+                metadata=item,
+            )
+            return video
+
+        # Look up each item's handler by its exact type
+        handlers = {
+            TracksEndpointResponseJSON: get_track,
+            VideosEndpointResponseJSON: get_video,
+        }
+
+        def get_item(item) -> Optional[Union[Track, Video]]:
+            handler = handlers.get(type(item))
+            if handler is None:
+                return None
+            # One item failing must not discard the rest of the mix,
+            # which are being retrieved alongside it
+            try:
+                return handler(item)
+            except Exception:
+                _msg: str = f"Could not retrieve item {item.id} of mix {self.mix_id}"
+                logger.exception(_msg)
+                return None
+
+        tracks_videos: List[Optional[Union[Track, Video]]] = map_concurrently(
+            get_item, self.items, concurrency, delay_ms
+        )
+        self.tracks_videos: Tuple[Optional[Union[Track, Video]]] = tuple(
+            tracks_videos
+        )
         return tracks_videos
 
     def flatten_mix_dir(self):
@@ -142,8 +171,11 @@ class Mix:
             return
 
         subdirs: Set[Path] = set()
+        # Resolve the absolute path of self.mix_dir only once, not per file
+        mix_dir: Path = self.mix_dir.absolute()
         for i, tv in enumerate(self.tracks_videos, 1):
-            if getattr(tv, "outfile") is None:
+            # Find all subdirectories written to, whether or not tv downloaded
+            if isinstance(tv, Track):
                 try:
                     getattr(tv, "album_dir")
                 except AttributeError:
@@ -151,6 +183,12 @@ class Mix:
                 else:
                     subdirs.add(tv.album_dir)
                     subdirs.add(tv.album_dir.parent)
+            elif isinstance(tv, Video):
+                subdirs.add(tv.artist_dir)
+
+            # if the item never got turned into a track or video, or failed
+            # before its output file was decided
+            if getattr(tv, "outfile", None) is None:
                 files[i - 1] = {i: None}
                 continue
 
@@ -171,59 +209,26 @@ class Mix:
 
             # otherwise, move files and clean up
             if isinstance(tv, Track):
-                new_path: Path = self.mix_dir / f"{i:03d} - {tv.trackname}"
-                new_path.write_bytes(_path.read_bytes())
-                _path.unlink()
-                files[i - 1] = {i: str(new_path.absolute())}
+                new_path: Path = mix_dir / f"{i:03d} - {tv.trackname}"
+                move_file(_path, new_path)
+                files[i - 1] = {i: str(new_path)}
             elif isinstance(tv, Video):
-                new_path: Path = self.mix_dir / f"{i:03d} - {_path.name}"
-                new_path.write_bytes(_path.read_bytes())
-                _path.unlink()
-                files[i - 1] = {i: str(new_path.absolute())}
+                new_path: Path = mix_dir / f"{i:03d} - {_path.name}"
+                move_file(_path, new_path)
+                files[i - 1] = {i: str(new_path)}
         else:
             self.files: List[Dict[int, Optional[str]]] = files
 
-        # Find all subdirectories written to
-        subdirs: Set[Path] = set()
-        for tv in self.tracks_videos:
-            if isinstance(tv, Track):
-                try:
-                    getattr(tv, "album_dir")
-                except AttributeError:
-                    pass
-                else:
-                    subdirs.add(tv.album_dir)
-                    subdirs.add(tv.album_dir.parent)
-            elif isinstance(tv, Video):
-                subdirs.add(tv.artist_dir)
-
-        # Copy all artist images, artist bio JSON files out
-        # of subdirs
-        artist_images: Set[Path] = set()
+        # Move all artist images, artist bio JSON files out of subdirs,
+        # listing each subdir only once
         for subdir in subdirs:
-            for p in subdir.glob("*.jpg"):
-                if p.name == "cover.jpg":
-                    continue
-                artist_images.add(p)
-        else:
-            for artist_image_path in artist_images:
-                if artist_image_path.exists():
-                    shutil.copyfile(
-                        artist_image_path.absolute(),
-                        self.mix_dir / artist_image_path.name,
-                    )
-
-        artist_bios: Set[Path] = set()
-        for subdir in subdirs:
-            for p in subdir.glob("*bio.json"):
-                artist_bios.add(p)
-        else:
-            for artist_bio_path in artist_bios:
-                if artist_bio_path.exists():
-                    shutil.copyfile(
-                        artist_bio_path.absolute(),
-                        self.mix_dir / artist_bio_path.name,
-                    )
+            try:
+                entries: List[os.DirEntry] = list(os.scandir(subdir))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if is_artist_file(entry):
+                    move_file(entry.path, self.mix_dir / entry.name)
 
         # Remove all subdirs
         for subdir in subdirs:
@@ -233,10 +238,10 @@ class Mix:
             return self.mix_dir
 
     def dumps(self):
-        return json.dumps(self.files)
+        return orjson.dumps(self.files, option=orjson.OPT_NON_STR_KEYS).decode()
 
     def dump(self, fp=sys.stdout):
-        json.dump(self.files, fp)
+        fp.write(orjson.dumps(self.files, option=orjson.OPT_NON_STR_KEYS).decode())
 
     def get(
         self,
@@ -244,6 +249,8 @@ class Mix:
         audio_format: AudioFormat,
         out_dir: Path,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ):
         """The main method of this class, executing a number of other methods
         in a row:
@@ -263,7 +270,12 @@ class Mix:
         self.set_items(session)
         self.set_mix_dir(out_dir)
 
-        if self.get_items(session, audio_format, no_extra_files) is None:
+        if (
+            self.get_items(
+                session, audio_format, no_extra_files, concurrency, delay_ms
+            )
+            is None
+        ):
             logger.critical(f"Could not retrieve mix with ID '{self.mix_id}'")
             self.files = {}
             return
@@ -280,11 +292,15 @@ class Mix:
         audio_format: AudioFormat,
         out_dir: Path,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ):
         """The main method of this class, executing a number of other methods
         in a row:
           - self.set_metadata()
           - self.set_items()
+        Up to `concurrency` tracks or videos are retrieved at a time, starting
+        each one `delay_ms` milliseconds after the last.
         """
         self.set_metadata(session)
         if self.metadata is None:
@@ -295,16 +311,11 @@ class Mix:
         if len(self.items) == 0:
             self.files = {}
             return
-        else:
-            files: List[Optional[str]] = [None] * len(self.items)
 
-        for i, item in enumerate(self.items):
-            if item is None:
-                files[i] = None
-                continue
-            elif isinstance(item, TracksEndpointResponseJSON):
+        def get_element(item) -> Optional[str]:
+            if isinstance(item, TracksEndpointResponseJSON):
                 track: Track = Track(track_id=item.id, transparent=self.transparent)
-                track_file: Optional[str] = track.get(
+                return track.get(
                     session=session,
                     audio_format=audio_format,
                     out_dir=out_dir,
@@ -312,20 +323,20 @@ class Mix:
                     no_extra_files=no_extra_files,
                     origin_jpg=False,
                 )
-                files[i] = track_file
             elif isinstance(item, VideosEndpointResponseJSON):
                 video: Video = Video(video_id=item.id, transparent=self.transparent)
-                video_file: Optional[str] = video.get(
+                return video.get(
                     session=session,
                     out_dir=self.mix_dir,
                     metadata=item,
                 )
-                files[i] = video_file
             else:
-                files[i] = None
-                continue
-        else:
-            self.files: List[Optional[str]] = files
+                return None
+
+        files: List[Optional[str]] = map_concurrently(
+            get_element, self.items, concurrency, delay_ms
+        )
+        self.files: List[Optional[str]] = files
 
 
 class TidalMixError(Exception):
@@ -346,6 +357,7 @@ def request_mix(
     json_name: str = f"pages-mix-{mix_id}_{uuid4().hex}.json"
 
     logger.info(f"Requesting from TIDAL API: mixes/{mix_id}")
+    api_rate_limiter.acquire()
     with session.get(**kwargs) as resp:
         try:
             resp.raise_for_status()
@@ -358,23 +370,22 @@ def request_mix(
                 logger.exception(he)
             return
         else:
+            page: dict = orjson.loads(resp.content)
             if transparent:
-                Path(json_name).write_text(
-                    json.dumps(resp.json(), ensure_ascii=True, indent=4, sort_keys=True)
+                Path(json_name).write_bytes(
+                    orjson.dumps(page, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
                 )
 
         d: Dict[str, str] = {
-            "title": resp.json().get("title"),
-            "description": resp.json().get("rows")[0]["modules"][0]["mix"]["subTitle"],
+            "title": page.get("title"),
+            "description": page.get("rows")[0]["modules"][0]["mix"]["subTitle"],
         }
         d["image"] = (
-            resp.json()
-            .get("rows", [{}])[0]
-            .get("modules")[0]["mix"]["images"]["LARGE"]["url"]
+            page.get("rows", [{}])[0].get("modules")[0]["mix"]["images"]["LARGE"]["url"]
         )
 
         logger.debug(
-            f"{resp.status_code} response from TIDAL API to request: pages/mix"
+            "%d response from TIDAL API to request: pages/mix", resp.status_code
         )
         return SimpleNamespace(**d)
 
@@ -398,6 +409,7 @@ def request_mixes_items(
 
     data: Optional[dict] = None
     logger.info(f"Requesting from TIDAL API: mixes/{mix_id}/items")
+    api_rate_limiter.acquire()
     with session.get(**kwargs) as resp:
         try:
             resp.raise_for_status()
@@ -409,19 +421,16 @@ def request_mixes_items(
             else:
                 logger.exception(he)
         else:
+            data = orjson.loads(resp.content)
             if transparent:
-                Path(json_name).write_text(
-                    json.dumps(resp.json(), ensure_ascii=True, indent=4, sort_keys=True)
-                )
-                data = resp.json()
-                logger.debug(
-                    f"{resp.status_code} response from TIDAL API to request: mixes/{mix_id}/items"
-                )
-            else:
-                data = resp.json()
-                logger.debug(
-                    f"{resp.status_code} response from TIDAL API to request: mixes/{mix_id}/items"
+                Path(json_name).write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
                 )
+            logger.debug(
+                "%d response from TIDAL API to request: mixes/%s/items",
+                resp.status_code,
+                mix_id,
+            )
         finally:
             return data
 
@@ -624,18 +624,52 @@ class PlaylistsEndpointResponseJSON(dataclass_wizard.JSONWizard):
     square_image: str  # UUID v4
 
 
+# Compiled once at import rather than on every TidalResource.match_url() call
+_ALBUM_URL_PATTERN: re.Pattern = re.compile(
+    r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
+    r"(?:browse/)?album/(\d{2,9})(?:.*?)?",
+    re.IGNORECASE,
+)
+_ARTIST_URL_PATTERN: re.Pattern = re.compile(
+    r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
+    r"(?:browse/)?artist/(\d{2,9})(?:.*?)?",
+    re.IGNORECASE,
+)
+_MIX_URL_PATTERN: re.Pattern = re.compile(
+    r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
+    r"(?:browse/)?mix/(\w{30})(?:.*?)?",
+    re.IGNORECASE,
+)
+_TRACK_URL_PATTERN: re.Pattern = re.compile(
+    r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
+    r"(?:browse/)?(?:album/\d{5,9}/)?track/(\d{5,9})(?:.*?)?",
+    re.IGNORECASE,
+)
+_PLAYLIST_URL_PATTERN: re.Pattern = re.compile(
+    r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/(?:browse/)?playlist/"
+    r"([0-9a-f]{8}\-[0-9a-f]{4}\-4[0-9a-f]{3}\-[89ab][0-9a-f]{3}\-[0-9a-f]{12})(?:.*?)?",
+    re.IGNORECASE,
+)
+_VIDEO_URL_PATTERN: re.Pattern = re.compile(
+    r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
+    r"(?:browse/)?video/(\d{7,9})(?:.*?)?",
+    re.IGNORECASE,
+)
+_URL_SCHEMES: tuple[str, str] = ("http://", "https://")
+
+
 class TidalResource:
     """Parent class to subclasses representing different TIDAL music
     service objects; e.g. Track, Album. This class is not meant to be
     instantiated itself: rather, its purpose is to pre-populate its
     subclasses with the `match_url` method."""
 
-    def __init__(self, pattern: str | None = None, url: str | None = None):
+    def __init__(self, pattern: re.Pattern | None = None, url: str | None = None):
         self.pattern = pattern
         self.url = url
 
     def match_url(self) -> int | str | None:
-        _match: re.Match = re.match(self.pattern, self.url, re.IGNORECASE)
+        _match: re.Match = self.pattern.match(self.url)
         try:
             _id: str = _match.groups()[0]
         except AttributeError:
@@ -652,10 +686,7 @@ class TidalAlbum(TidalResource):
     url: str
 
     def __post_init__(self):
-        self.pattern: str = (
-            r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
-            r"(?:browse/)?album/(\d{2,9})(?:.*?)?"
-        )
+        self.pattern: re.Pattern = _ALBUM_URL_PATTERN
         _id = self.match_url()
 
         if _id is None:
@@ -676,10 +707,7 @@ class TidalArtist(TidalResource):
     url: str
 
     def __post_init__(self):
-        self.pattern: str = (
-            r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
-            r"(?:browse/)?artist/(\d{2,9})(?:.*?)?"
-        )
+        self.pattern: re.Pattern = _ARTIST_URL_PATTERN
         _id = self.match_url()
 
         if _id is None:
@@ -700,10 +728,7 @@ class TidalMix(TidalResource):
     url: str
 
     def __post_init__(self):
-        self.pattern: str = (
-            r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
-            r"(?:browse/)?mix/(\w{30})(?:.*?)?"
-        )
+        self.pattern: re.Pattern = _MIX_URL_PATTERN
         _id = self.match_url()
 
         if _id is None:
@@ -724,10 +749,7 @@ class TidalTrack(TidalResource):
     url: str
 
     def __post_init__(self):
-        self.pattern: str = (
-            r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
-            r"(?:browse/)?(?:album/\d{5,9}/)?track/(\d{5,9})(?:.*?)?"
-        )
+        self.pattern: re.Pattern = _TRACK_URL_PATTERN
         _id = self.match_url()
 
         if _id is None:
@@ -748,10 +770,7 @@ class TidalPlaylist(TidalResource):
     url: str
 
     def __post_init__(self):
-        self.pattern: str = (
-            r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/(?:browse/)?playlist/"
-            r"([0-9a-f]{8}\-[0-9a-f]{4}\-4[0-9a-f]{3}\-[89ab][0-9a-f]{3}\-[0-9a-f]{12})(?:.*?)?"
-        )
+        self.pattern: re.Pattern = _PLAYLIST_URL_PATTERN
 
         _id = self.match_url()
 
@@ -773,10 +792,7 @@ class TidalVideo(TidalResource):
     url: str
 
     def __post_init__(self):
-        self.pattern: str = (
-            r"http(?:s)?://(?:listen\.|www\.)?tidal\.com/"
-            r"(?:browse/)?video/(\d{7,9})(?:.*?)?"
-        )
+        self.pattern: re.Pattern = _VIDEO_URL_PATTERN
         _id = self.match_url()
 
         if _id is None:
@@ -795,6 +811,10 @@ def match_tidal_url(input_str: str) -> TidalResource | None:
     parsed input_str type
     """
     resource_match: TidalResource | None = None
+    # Every pattern is anchored to 'http(s)://', so skip them all otherwise
+    if not input_str[:8].lower().startswith(_URL_SCHEMES):
+        return resource_match
+
     tidal_resources: tuple[
         TidalResource,
         TidalResource,
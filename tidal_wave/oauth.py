@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import base64
-import json
+import binascii
 import logging
+import os
 import sys
 import time
 from dataclasses import dataclass, field
@@ -13,6 +14,7 @@ from email.utils import parsedate_to_datetime
 from typing import TYPE_CHECKING
 
 import dataclass_wizard
+import orjson
 import requests
 from platformdirs import user_config_path
 
@@ -32,6 +34,16 @@ OAUTH2_HEADERS: dict[str, str] = {
 logger = logging.getLogger(__name__)
 
 
+def write_token_file(p: Path, data: bytes) -> None:
+    """Write `data` to `p` with a single os.write, readable only by the owner."""
+    flags: int = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd: int = os.open(p, flags, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 class AuthorizationError(Exception):
     """Exception that is raised upon unsuccessful interaction with TIDAL API."""
 
@@ -150,8 +162,8 @@ class BearerToken:
             "user_id": self.user_id,
             "user_name": self.user_name,
         }
-        outdata: bytes = base64.b64encode(json.dumps(d).encode("UTF-8"))
-        p.write_bytes(outdata)
+        outdata: bytes = base64.b64encode(orjson.dumps(d))
+        write_token_file(p, outdata)
 
     @classmethod
     def load(
@@ -171,13 +183,13 @@ class BearerToken:
             return None
 
         try:
-            data = json.loads(base64.b64decode(token_path_bytes))
-        except json.JSONDecodeError:
+            data = orjson.loads(base64.b64decode(token_path_bytes))
+        except orjson.JSONDecodeError:
             logger.exception(
                 TokenError(f"Could not parse JSON data from '{p.absolute()}'"),
             )
             return None
-        except UnicodeDecodeError:
+        except binascii.Error:
             logger.exception(
                 TokenError(
                     f"File '{p.absolute()}' does not appear to be base64-encoded",
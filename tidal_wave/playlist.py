@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import math
+import os
 import shutil
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
@@ -15,6 +16,7 @@ from uuid import uuid4
 
 import ffmpeg
 import mutagen
+import orjson
 from requests import HTTPError, Session
 
 from .models import (
@@ -26,7 +28,11 @@ from .requesting import request_playlists
 from .track import Track
 from .utils import (
     TIDAL_API_URL,
+    api_rate_limiter,
     download_cover_image,
+    is_artist_file,
+    map_concurrently,
+    move_file,
     replace_illegal_characters,
     temporary_file,
 )
@@ -113,40 +119,62 @@ class Playlist:
         session: Session,
         audio_format: AudioFormat,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ) -> tuple[Track | Video | None] | None:
         """Using either Track.get() or Video.get(), attempt to request
-        the data for each track or video in self.items. If no_extra_files
-        is True, do not attempt to retrieve or save any of: playlist
-        description text, playlist m3u8 text, playlist cover image."""
+        the data for each track or video in self.items, up to `concurrency`
+        at a time and `delay_ms` milliseconds apart. If no_extra_files is
+        True, do not attempt to retrieve or save any of: playlist description
+        text, playlist m3u8 text, playlist cover image."""
         if len(self.items) == 0:
             return None
-        tracks_videos: list = [None] * len(self.items)
-        for i, item in enumerate(self.items):
-            if item is None:
-                tracks_videos[i] = None
-                continue
-            if isinstance(item, TracksEndpointResponseJSON):
-                track: Track = Track(track_id=item.id, transparent=self.transparent)
-                track.get(
-                    session=session,
-                    audio_format=audio_format,
-                    out_dir=self.playlist_dir,
-                    metadata=item,
-                    no_extra_files=no_extra_files,
-                    origin_jpg=False,
-                )
-                tracks_videos[i] = track
-            elif isinstance(item, VideosEndpointResponseJSON):
-                video: Video = Video(video_id=item.id, transparent=self.transparent)
-                video.get(
-                    session=session,
-                    out_dir=self.playlist_dir,
-                    metadata=item,
+
+        def get_track(item: TracksEndpointResponseJSON) -> Track:
+            track: Track = Track(track_id=item.id, transparent=self.transparent)
+            track.get(
+                session=session,
+                audio_format=audio_format,
+                out_dir=self.playlist_dir,
+                metadata=item,
+                no_extra_files=no_extra_files,
+                origin_jpg=False,
+            )
+            return track
+
+        def get_video(item: VideosEndpointResponseJSON) -> Video:
+            video: Video = Video(video_id=item.id, transparent=self.transparent)
+            video.get(
+                session=session,
+                out_dir=self.playlist_dir,
+                metadata=item,
+            )
+            return video
+
+        # Look up each item's handler by its exact type
+        handlers = {
+            TracksEndpointResponseJSON: get_track,
+            VideosEndpointResponseJSON: get_video,
+        }
+
+        def get_item(item) -> Track | Video | None:
+            handler = handlers.get(type(item))
+            if handler is None:
+                return None
+            # One item failing must not discard the rest of the playlist,
+            # which are being retrieved alongside it
+            try:
+                return handler(item)
+            except Exception:
+                _msg: str = (
+                    f"Could not retrieve item {item.id} of playlist {self.playlist_id}"
                 )
-                tracks_videos[i] = video
-            else:
-                tracks_videos[i] = None
-                continue
+                logger.exception(_msg)
+                return None
+
+        tracks_videos: list = map_concurrently(
+            get_item, self.items, concurrency, delay_ms
+        )
         self.tracks_videos: tuple[Track | Video | None] = tuple(tracks_videos)
         return tracks_videos
 
@@ -161,9 +189,12 @@ class Playlist:
         if len(self.tracks_videos) == 0:
             return None
         subdirs: set[Path] = set()
+        # Resolve the absolute path of self.playlist_dir only once, not per file
+        playlist_dir: Path = self.playlist_dir.absolute()
 
         for i, tv in enumerate(self.tracks_videos, 1):
-            if tv.outfile is None:
+            # Find all subdirectories written to, whether or not tv downloaded
+            if isinstance(tv, Track):
                 try:
                     _ = tv.album_dir
                 except AttributeError:
@@ -171,6 +202,12 @@ class Playlist:
                 else:
                     subdirs.add(tv.album_dir)
                     subdirs.add(tv.album_dir.parent)
+            elif isinstance(tv, Video):
+                subdirs.add(tv.artist_dir)
+
+            # if the item never got turned into a track or video, or failed
+            # before its output file was decided
+            if getattr(tv, "outfile", None) is None:
                 files[i - 1] = {i: None}
                 continue
 
@@ -191,55 +228,25 @@ class Playlist:
 
             # otherwise, move files and clean up
             if isinstance(tv, Track):
-                new_path: Path = self.playlist_dir / f"{i:03d} - {tv.trackname}"
-                new_path.write_bytes(_path.read_bytes())
-                _path.unlink()
-                files[i - 1] = {i: str(new_path.absolute())}
+                new_path: Path = playlist_dir / f"{i:03d} - {tv.trackname}"
+                move_file(_path, new_path)
+                files[i - 1] = {i: str(new_path)}
             elif isinstance(tv, Video):
-                new_path: Path = self.playlist_dir / f"{i:03d} - {_path.name}"
-                new_path.write_bytes(_path.read_bytes())
-                _path.unlink()
-                files[i - 1] = {i: str(new_path.absolute())}
+                new_path: Path = playlist_dir / f"{i:03d} - {_path.name}"
+                move_file(_path, new_path)
+                files[i - 1] = {i: str(new_path)}
         self.files: list[dict[int, str | None]] = files
 
-        # Find all subdirectories written to
-        for tv in self.tracks_videos:
-            if isinstance(tv, Track):
-                try:
-                    _ = tv.album_dir
-                except AttributeError:
-                    pass
-                else:
-                    subdirs.add(tv.album_dir)
-                    subdirs.add(tv.album_dir.parent)
-            elif isinstance(tv, Video):
-                subdirs.add(tv.artist_dir)
-
-        # Copy all artist images, artist bio JSON files out
-        # of subdirs
-        artist_images: set[Path] = set()
-        for subdir in subdirs:
-            for p in subdir.glob("*.jpg"):
-                if p.name == "cover.jpg":
-                    continue
-                artist_images.add(p)
-        for artist_image_path in artist_images:
-            if artist_image_path.exists():
-                shutil.copyfile(
-                    artist_image_path.absolute(),
-                    self.playlist_dir / artist_image_path.name,
-                )
-
-        artist_bios: set[Path] = set()
+        # Move all artist images, artist bio JSON files out of subdirs,
+        # listing each subdir only once
         for subdir in subdirs:
-            for p in subdir.glob("*bio.json"):
-                artist_bios.add(p)
-        for artist_bio_path in artist_bios:
-            if artist_bio_path.exists():
-                shutil.copyfile(
-                    artist_bio_path.absolute(),
-                    self.playlist_dir / artist_bio_path.name,
-                )
+            try:
+                entries: list[os.DirEntry] = list(os.scandir(subdir))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if is_artist_file(entry):
+                    move_file(entry.path, self.playlist_dir / entry.name)
 
         # Remove all subdirs
         for subdir in subdirs:
@@ -317,7 +324,7 @@ class Playlist:
         which is an array of objects with one key each: the index in the
         playlist of the track or video, and the absolute file path to the
         track or video"""
-        return json.dumps(self.files)
+        return orjson.dumps(self.files, option=orjson.OPT_NON_STR_KEYS).decode()
 
     def dump(self, fp=sys.stdout):
         """This method emulates the stdlib json.dump(). In particular,
@@ -325,7 +332,7 @@ class Playlist:
         which is an array of objects with one key each: the index in the
         playlist of the track or video, and the absolute file path to the
         track or video"""
-        json.dump(self.files, fp)
+        fp.write(orjson.dumps(self.files, option=orjson.OPT_NON_STR_KEYS).decode())
 
     def get(
         self,
@@ -333,19 +340,22 @@ class Playlist:
         audio_format: AudioFormat,
         out_dir: Path,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ):
         """Execute a number of other methods in a row.
 
         The methods are:
           - self.set_metadata()
-          - self.set_items()
           - self.set_playlist_dir()
+          - self.set_items()
           - self.get_items()
           - self.flatten_playlist_dir()
         Then, if no_extra_files is False,
-          - self.save_cover_image()
           - self.save_description()
           - self.craft_m3u8_text()
+        If no_extra_files is False, self.save_cover_image() is executed in a
+        separate thread while self.set_items() is requesting the playlist items.
         """
         self.set_metadata(session)
 
@@ -353,10 +363,21 @@ class Playlist:
             self.files = {}
             return
 
-        self.set_items(session)
         self.set_playlist_dir(out_dir)
+        cover_future: Future | None = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if not no_extra_files:
+                cover_future = executor.submit(
+                    self.save_cover_image, session, out_dir
+                )
+            self.set_items(session)
 
-        if self.get_items(session, audio_format, no_extra_files) is None:
+        if (
+            self.get_items(
+                session, audio_format, no_extra_files, concurrency, delay_ms
+            )
+            is None
+        ):
             _msg: str = f"Could not retrieve playlist with ID '{self.playlist_id}'"
             logger.critical(_msg)
             self.files = {}
@@ -378,7 +399,7 @@ class Playlist:
                 )
                 logger.info(_msg)
 
-            self.save_cover_image(session, out_dir)
+            cover_future.result()
 
             try:
                 m3u8_text: str = self.craft_m3u8_text()
@@ -403,6 +424,8 @@ class Playlist:
         audio_format: AudioFormat,
         out_dir: Path,
         no_extra_files: bool,
+        concurrency: int = 1,
+        delay_ms: int = 0,
     ) -> None:
         """Execute a number of other methods in a row.
 
@@ -410,6 +433,8 @@ class Playlist:
         the program top level. The methods executed are:
           - self.set_metadata()
           - self.set_items()
+        Up to `concurrency` tracks or videos are retrieved at a time, starting
+        each one `delay_ms` milliseconds after the last.
         """
         self.set_metadata(session)
 
@@ -421,15 +446,11 @@ class Playlist:
         if len(self.items) == 0:
             self.files = {}
             return
-        files: list[dict[int, str | None]] = [None] * len(self.items)
 
-        for i, item in enumerate(self.items):
-            if item is None:
-                files[i] = {i: None}
-                continue
+        def get_element(item) -> str | None:
             if isinstance(item, TracksEndpointResponseJSON):
                 track: Track = Track(track_id=item.id, transparent=self.transparent)
-                track_file: str | None = track.get(
+                return track.get(
                     session=session,
                     audio_format=audio_format,
                     out_dir=out_dir,
@@ -437,18 +458,22 @@ class Playlist:
                     no_extra_files=no_extra_files,
                     origin_jpg=False,
                 )
-                files[i] = {i: track_file}
             elif isinstance(item, VideosEndpointResponseJSON):
                 video: Video = Video(video_id=item.id, transparent=self.transparent)
-                video_file: str | None = video.get(
+                return video.get(
                     session=session,
                     out_dir=out_dir,
                     metadata=item,
                 )
-                files[i] = {i: video_file}
             else:
-                files[i] = {i: None}
-                continue
+                return None
+
+        files: list[dict[int, str | None]] = [
+            {i: f}
+            for i, f in enumerate(
+                map_concurrently(get_element, self.items, concurrency, delay_ms)
+            )
+        ]
         self.files: list[dict[int, str | None]] = files
 
 
@@ -478,6 +503,7 @@ def request_playlists_items(
     data: dict | None = None
     _msg: str = f"Requesting from TIDAL API: playlists/{playlist_id}/items"
     logger.info(_msg)
+    api_rate_limiter.acquire()
     with session.get(**kwargs) as r:
         try:
             r.raise_for_status()
@@ -495,11 +521,11 @@ def request_playlists_items(
             f"{r.status_code} response from TIDAL API to request: "
             f"playlists/{playlist_id}/items"
         )
+        data = orjson.loads(r.content)
         if transparent:
-            Path(json_name).write_text(
-                json.dumps(r.json(), ensure_ascii=True, indent=4, sort_keys=True),
+            Path(json_name).write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS),
             )
-        data = r.json()
         logger.debug(_msg)
         return data
 
@@ -1,14 +1,18 @@
 """Create helper functions to request data from various TIDAL API endpoints."""
 
-import json
 import logging
+import re
 from functools import partial
 from pathlib import Path
-from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import urlsplit
 from uuid import uuid4
 
 import backoff
+import orjson
+from cachecontrol.heuristics import ExpiresAfter
 from requests import HTTPError, Response, Session
+from urllib3 import HTTPResponse
 
 from .models import (
     AlbumsCreditsResponseJSON,
@@ -30,7 +34,7 @@ from .models import (
     VideosEndpointResponseJSON,
     VideosEndpointStreamResponseJSON,
 )
-from .utils import TIDAL_API_URL
+from .utils import TIDAL_API_URL, api_rate_limiter
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -56,6 +60,47 @@ ResponseJSON = Union[
 ]
 
 
+# The public catalog endpoints of TIDAL API, whose responses are the same for
+# every account, so they may be persisted on disk. Anything else, e.g.
+# /tracks/{id}/lyrics, /tracks/{id}/playbackinfopostpaywall, /playlists, or
+# /sessions, depends on the access token or contains expiring URLs.
+CACHEABLE_API_PATH: re.Pattern = re.compile(
+    r"/(?:albums/\d+(?:/(?:items|credits|review))?"
+    r"|artists/\d+(?:/(?:bio|albums|videos))?"
+    r"|tracks/\d+(?:/credits)?)/?$"
+)
+
+
+class TidalAPIHeuristic(ExpiresAfter):
+    """Cache public TIDAL catalog responses for a fixed period.
+
+    Only responses from endpoints matching CACHEABLE_API_PATH may be cached:
+    any other response is marked 'no-store', whatever its own headers say.
+    Cacheable responses that specify Cache-Control or Expires are left as
+    they are; those that do not are cached for the configured period.
+    """
+
+    @staticmethod
+    def is_cacheable(response: HTTPResponse) -> bool:
+        """Whether `response` comes from a public catalog endpoint."""
+        path: str = urlsplit(response.geturl() or "").path
+        return CACHEABLE_API_PATH.search(path) is not None
+
+    def update_headers(self, response: HTTPResponse) -> Dict[str, str]:
+        """Return ExpiresAfter's headers only if `response` may be cached."""
+        if not self.is_cacheable(response):
+            return {"cache-control": "no-store"}
+        if ("cache-control" in response.headers) or ("expires" in response.headers):
+            return {}
+        return super().update_headers(response)
+
+    def warning(self, response: HTTPResponse) -> Optional[str]:
+        """Only warn of staleness for responses that may be cached."""
+        if not self.is_cacheable(response):
+            return None
+        return super().warning(response)
+
+
 def requester_maker(
     session: Session,
     endpoint: str,
@@ -94,6 +139,7 @@ def requester_maker(
         def _get(s: Session, request_kwargs: dict) -> Response:
             """Return a requests.Response object from having passed request_kwargs
             to s.get(), optionally retrying if 429 error occurs."""
+            api_rate_limiter.acquire()
             with s.get(**request_kwargs) as r:
                 return r
 
@@ -117,20 +163,21 @@ def requester_maker(
             logger.exception(he)
             return None
 
+        payload = orjson.loads(resp.content)
         if t:
             json_name: str = (
                 f"{e}-{i}-{u.strip('/')}_{uuid4().hex}.json"
                 if u != ""
                 else f"{e}-{i}_{uuid4().hex}.json"
             )
-            Path(json_name).write_text(
-                json.dumps(resp.json(), ensure_ascii=True, indent=4, sort_keys=True)
+            Path(json_name).write_bytes(
+                orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
             )
 
         if cf:
-            data = sc.from_dict({"credits": resp.json()})
+            data = sc.from_dict({"credits": payload})
         else:
-            data = sc.from_dict(resp.json())
+            data = sc.from_dict(payload)
 
         return data
 
@@ -487,21 +534,21 @@ def get_album_id(session: Session, track_id: int) -> Optional[int]:
 def contiguous_ranges(value: int, range_size: int) -> Iterator[Tuple[int, int]]:
     """This function is a generator: it yields two-tuples of int, with the
     tuples representing the (inclusive) boundaries of ranges of size
-    range_size. The final tuple will represent a range <= range_size if
-    range_size does not evenly divide value. E.g.
-    ```>>> list(ranges(16, 3))
-    [(0, 2), (3, 5), (6, 8), (9, 11), (12, 14), (15, 16)]
+    range_size that together cover the `value` bytes 0 through value - 1.
+    The final tuple will represent a range < range_size if range_size does
+    not evenly divide value. E.g.
+    ```>>> list(contiguous_ranges(16, 3))
+    [(0, 2), (3, 5), (6, 8), (9, 11), (12, 14), (15, 15)]
+    >>> list(contiguous_ranges(16, 4))
+    [(0, 3), (4, 7), (8, 11), (12, 15)]
     ```
     N.b. the first tuple will always have first element 0 and the final tuple
-    will always have second element `value`."""
-    i: int = 0
+    will always have second element `value - 1`; no range starts at or after
+    `value`, which a server would answer with 416 Range Not Satisfiable."""
     rs: int = range_size - 1
-    while i + rs < value:
-        t: Tuple[int, int] = (i, i + rs)
-        i = t[-1] + 1
+    for i in range(0, value, range_size):
+        t: Tuple[int, int] = (i, min(i + rs, value - 1))
         yield t
-    else:
-        yield (i, value)
 
 
 def http_request_range_headers(
@@ -517,7 +564,7 @@ def http_request_range_headers(
      'bytes=6-8',
      'bytes=9-11',
      'bytes=12-14',
-     'bytes=15-16')
+     'bytes=15-15')
     ```
     """
     ranges: Iterator[Tuple[int, int]] = contiguous_ranges(content_length, range_size)
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import shlex
 import shutil
 import subprocess
 import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, TYPE_CHECKING
+from tempfile import SpooledTemporaryFile
+from typing import Callable, Mapping, TYPE_CHECKING
 
 import ffmpeg
 import mutagen
+import orjson
 from Crypto.Cipher import AES
 from Crypto.Util import Counter
 from mutagen.mp4 import MP4Cover
@@ -28,7 +33,7 @@ from .dash import (
     XMLDASHManifest,
     manifester,
 )
-from .media import TAG_MAPPING, AudioFormat
+from .media import FREEFORM_TAGS_M4A, AudioFormat, get_tag_map
 from .models import (
     AlbumsEndpointResponseJSON,
     ArtistsBioResponseJSON,
@@ -39,8 +44,8 @@ from .models import (
     download_artist_image,
 )
 from .requesting import (
+    contiguous_ranges,
     fetch_content_length,
-    http_request_range_headers,
     request_albums,
     request_artist_bio,
     request_credits,
@@ -48,13 +53,89 @@ from .requesting import (
     request_stream,
     request_tracks,
 )
-from .utils import IMAGE_URL, download_cover_image, temporary_file
+from .utils import (
+    DOWNLOAD_CHUNK_SIZE,
+    IMAGE_URL,
+    cancel_and_close,
+    download_cover_image,
+    link_or_copy,
+    map_concurrently,
+    temporary_file,
+)
 
 if TYPE_CHECKING:
     from requests import Session
 
+    from .models import Artist
+
 logger = logging.getLogger("__name__")
 
+# The value of the audioquality parameter sent to TIDAL API for each AudioFormat
+AF_AQ: dict[AudioFormat, str] = {
+    AudioFormat.dolby_atmos: "LOW",
+    AudioFormat.hi_res: "HI_RES",
+    AudioFormat.lossless: "LOSSLESS",
+    AudioFormat.high: "HIGH",
+    AudioFormat.low: "LOW",
+}
+
+# The file extension for each codec that TIDAL API manifests can specify
+# https://dashif.org/codecs/audio/
+CODEC_MAP: dict[str, str] = {
+    "flac": "flac",
+    "mqa": "flac",  # MQA is carried in a FLAC stream
+    "mp4a.40.5": "m4a",  # HE-AAC
+    "mp4a.40.29": "m4a",  # HE-AAC v2
+    "mp4a.40.2": "m4a",  # AAC-LC
+    "eac3": "m4a",  # Enhanced AC-3
+    "mp4a.40.34": "mp3",  # MP3
+}
+
+# The codec that TIDAL API serves for each AudioFormat, except for HiRes,
+# whose file name depends on the bit depth and sample rate of the stream
+AF_CODEC: dict[AudioFormat, str] = {
+    AudioFormat.dolby_atmos: "m4a",
+    AudioFormat.lossless: "flac",
+    AudioFormat.high: "m4a",
+    AudioFormat.low: "m4a",
+}
+
+# The marker appended to a track's file name for each AudioFormat
+AF_SUFFIX: dict[AudioFormat, str] = {
+    AudioFormat.dolby_atmos: "[A]",
+    AudioFormat.hi_res: "[HiRes]",
+    AudioFormat.lossless: "[CD]",
+    AudioFormat.high: "[H]",
+    AudioFormat.low: "[L]",
+}
+
+# How many byte ranges of a single-URL track are requested at the same time
+RANGE_REQUEST_CONCURRENCY: int = 4
+
+# How many artist images and bios of a track are requested at the same time
+ARTIST_ASSET_CONCURRENCY: int = 4
+
+# How many DASH segments of a track are requested at the same time. Each is
+# held in memory up to DOWNLOAD_CHUNK_SIZE bytes, beyond which it spills to disk
+SEGMENT_CONCURRENCY: int = 6
+
+# Tracks of the same album can be retrieved concurrently, and they share the
+# album's cover.jpg: so, downloading, embedding, and removing it is serialized
+_cover_locks: dict[Path, threading.Lock] = {}
+
+
+def _cover_lock(cover_path: Path) -> threading.Lock:
+    """Return the lock guarding `cover_path`, creating it if necessary."""
+    return _cover_locks.setdefault(cover_path, threading.Lock())
+
+
+# Tracks of one album, e.g. in a playlist or mix, need the same album
+# metadata: keep what TIDAL API returned for the ALBUMS_CACHE_SIZE most
+# recently used album IDs
+ALBUMS_CACHE_SIZE: int = 128
+_albums: OrderedDict[int, AlbumsEndpointResponseJSON] = OrderedDict()
+_albums_lock: threading.Lock = threading.Lock()
+
 
 @dataclass
 class Track:
@@ -66,13 +147,7 @@ class Track:
     def __post_init__(self):
         self._has_lyrics: bool | None = None
         self.tags: dict = {}
-        self.af_aq: dict[AudioFormat, str] = {
-            AudioFormat.dolby_atmos: "LOW",
-            AudioFormat.hi_res: "HI_RES",
-            AudioFormat.lossless: "LOSSLESS",
-            AudioFormat.high: "HIGH",
-            AudioFormat.low: "LOW",
-        }
+        self.cover_bytes: bytes | None = None
 
     def set_metadata(self, session: Session):
         """Populate self.metadata after executing request_tracks().
@@ -93,13 +168,27 @@ class Track:
         This method executes request_albums, passing in 'session' and
         self.metadata.album.id. If an error occurs, self.album is set to None.
         Otherwise, self.album is set to the response of request_albums(),
-        an AlbumsEndpointResponseJSON instance.
+        an AlbumsEndpointResponseJSON instance. A successful response is
+        re-used for later tracks of the same album, as long as it is among the
+        ALBUMS_CACHE_SIZE most recently used.
         """
-        self.album: AlbumsEndpointResponseJSON | None = request_albums(
-            session=session,
-            album_id=self.metadata.album.id,
-            transparent=self.transparent,
-        )
+        album_id: int = self.metadata.album.id
+        with _albums_lock:
+            self.album: AlbumsEndpointResponseJSON | None = _albums.get(album_id)
+            if self.album is not None:
+                _albums.move_to_end(album_id)
+        if self.album is None:
+            self.album = request_albums(
+                session=session,
+                album_id=album_id,
+                transparent=self.transparent,
+            )
+            if self.album is not None:
+                with _albums_lock:
+                    _albums[album_id] = self.album
+                    _albums.move_to_end(album_id)
+                    if len(_albums) > ALBUMS_CACHE_SIZE:
+                        _albums.popitem(last=False)
 
     def set_credits(self, session: Session):
         """Execute request_credits, using the output to populate self.credits.
@@ -138,7 +227,7 @@ class Track:
         The value populated is either None (in the event of request error),
         or TracksEndpointStreamResponseJSON.
         """
-        aq: str | None = self.af_aq.get(audio_format)
+        aq: str | None = AF_AQ.get(audio_format)
         self.stream: TracksEndpointStreamResponseJSON | None = request_stream(
             session,
             self.track_id,
@@ -156,18 +245,14 @@ class Track:
             self.codec = None
             return
 
-        # https://dashif.org/codecs/audio/
-        if self.manifest.codecs == "flac":
-            self.codec = "flac"
-        elif self.manifest.codecs in {
-            "mp4a.40.5",  # HE-AAC
-            "mp4a.40.29",  # HE-AAC v2
-            "mp4a.40.2",  # AAC-LC
-            "eac3",  # Enhanced AC-3
-        }:
-            self.codec = "m4a"
-        elif self.manifest.codecs == "mp4a.40.34":  # MP3
-            self.codec = "mp3"
+        self.codec: str | None = CODEC_MAP.get(self.manifest.codecs)
+        if self.codec is None:
+            _msg: str = (
+                f"Track {self.track_id} is encoded with codec "
+                f"'{self.manifest.codecs}', which is not supported"
+            )
+            logger.warning(_msg)
+            self.manifest = None
 
     def set_album_dir(self, out_dir: Path):
         """Populate self.album_dir, based on self.album and out_dir.
@@ -193,40 +278,34 @@ class Track:
             volume_substring: str = f"Volume {self.metadata.volume_number}"
             (self.album_dir / volume_substring).mkdir(parents=True, exist_ok=True)
 
-    def set_filename(self, audio_format: AudioFormat):
-        """Populate self.filename, which is based on self.metadata, audio_format.
+    def set_effective_format(self, audio_format: AudioFormat):
+        """Populate self.effective_format, the format TIDAL actually serves.
 
-        Additionally, if the available codecs in self.manifest don't match
-        audio_format, warnings are logged.
+        This is audio_format, unless self.stream shows that the track is
+        only available in a lower quality, in which case a warning is logged.
         """
-        _track_part: str = f"{self.metadata.track_number:02d} - {self.metadata.name}"
-        if audio_format == AudioFormat.low:
-            track_substring: str = f"{_track_part} [L]"
-        elif audio_format == AudioFormat.high:
-            track_substring: str = f"{_track_part} [H]"
-        elif audio_format == AudioFormat.lossless:
-            track_substring: str = f"{_track_part} [CD]"
-        elif audio_format == AudioFormat.hi_res:
-            track_substring: str = f"{_track_part} [HiRes]"
-        elif audio_format == AudioFormat.dolby_atmos:
-            track_substring: str = f"{_track_part} [A]"
-        else:
-            track_substring: str = _track_part
+        self.effective_format: AudioFormat = audio_format
 
         # Check for MQA masquerading as HiRes here
-        if audio_format == AudioFormat.hi_res:
-            if (self.stream.bit_depth == 16) and (self.stream.sample_rate == 44_100):
-                logger.warning(
-                    "Even though HiRes audio format was requested, and TIDAL responded "
-                    " to that request without error, this track is only available in "
-                    "lossless format; i.e. 16-bit 44.1 kHz quality. Downloading of "
-                    "track will continue, but it will be marked as Lossless ([CD]).",
-                )
-                self.filename: str | None = f"{_track_part} [CD].{self.codec}"
-            else:
-                self.filename: str | None = f"{track_substring}.{self.codec}"
-        else:
-            self.filename: str | None = f"{track_substring}.{self.codec}"
+        if (audio_format is AudioFormat.hi_res) and (
+            (self.stream.bit_depth, self.stream.sample_rate) == (16, 44_100)
+        ):
+            logger.warning(
+                "Even though HiRes audio format was requested, and TIDAL responded "
+                " to that request without error, this track is only available in "
+                "lossless format; i.e. 16-bit 44.1 kHz quality. Downloading of "
+                "track will continue, but it will be marked as Lossless ([CD]).",
+            )
+            self.effective_format = AudioFormat.lossless
+
+    def set_filename(self, audio_format: AudioFormat):
+        """Populate self.filename, which is based on self.metadata, audio_format."""
+        _track_part: str = f"{self.metadata.track_number:02d} - {self.metadata.name}"
+        suffix: str | None = AF_SUFFIX.get(audio_format)
+        track_substring: str = (
+            _track_part if suffix is None else f"{_track_part} {suffix}"
+        )
+        self.filename: str | None = f"{track_substring}.{self.codec}"
 
         # for use in playlist file ordering
         if self.filename is None:
@@ -248,10 +327,10 @@ class Track:
             self.outfile: Path = (
                 self.album_dir / f"Volume {self.metadata.volume_number}" / self.filename
             )
-            self.absolute_outfile = str(self.outfile.absolute())
         else:
             self.outfile: Path = self.album_dir / self.filename
-            self.absolute_outfile = str(self.outfile.absolute())
+        # Resolve the absolute path once, for all the logging and FFmpeg calls
+        self.absolute_outfile: str = str(self.outfile.absolute())
 
         # Keep absolute_outfile under 260-character limit
         if len(self.absolute_outfile) >= 260:
@@ -267,7 +346,7 @@ class Track:
                 return
 
             self.outfile: Path = Path(self.absolute_outfile).parent / outfile
-            self.absolute_outfile: str = str(self.outfile.absolute())
+            self.absolute_outfile: str = str(self.outfile)
             self.trackname: str = outfile
 
         if (self.outfile.exists()) and (self.outfile.stat().st_size > 0):
@@ -279,36 +358,51 @@ class Track:
             return None
         return self.outfile
 
-    def save_artist_image(self, session: Session):
-        """Write a JPEG with the name of all self.metadata.artists to self.album_dir."""
+    def save_artist_image(self, session: Session, artist: Artist):
+        """Write a JPEG with the name of `artist` to self.album_dir."""
+        download_artist_image(session, artist, self.album_dir, dimension=750)
+
+    def save_artist_bio(self, session: Session, artist: Artist):
+        """Write a JSON file containing the bio of `artist` to self.album_dir."""
+        artist_bio: ArtistsBioResponseJSON | None = request_artist_bio(
+            session=session,
+            artist_id=artist.id,
+            transparent=self.transparent,
+        )
+        if artist_bio is not None:
+            track_artist_bio_json: Path = self.album_dir / f"{artist.name}-bio.json"
+            _msg: str = (
+                f"Writing artist bio for artist {artist.id} to "
+                f"'{track_artist_bio_json.absolute()}"
+            )
+            logger.info(_msg)
+            track_artist_bio_json.write_text(artist_bio.to_json())
+
+    def save_artist_assets(self, session: Session):
+        """Write the image and bio of each of self.metadata.artists to self.album_dir.
+
+        Only the files not already in self.album_dir are requested, and
+        the requests are sent concurrently. As these files are extras, a
+        failure to save any one of them is ignored.
+        """
+        tasks: list[tuple[Callable[[Session, Artist], None], Artist]] = []
         for a in self.metadata.artists:
             track_artist_image: Path = (
                 self.album_dir / f"{a.name.replace('..', '').replace('/', 'and')}.jpg"
             )
             if not track_artist_image.exists():
-                download_artist_image(session, a, self.album_dir, dimension=750)
-
-    def save_artist_bio(self, session: Session):
-        """Write a JSON file to self.album_dir.
+                tasks.append((self.save_artist_image, a))
 
-        The JSON file written contains the name of each of
-        self.metadata.artists to self.album_dir.
-        """
-        for a in self.metadata.artists:
             track_artist_bio_json: Path = self.album_dir / f"{a.name}-bio.json"
             if not track_artist_bio_json.exists():
-                artist_bio: ArtistsBioResponseJSON | None = request_artist_bio(
-                    session=session,
-                    artist_id=a.id,
-                    transparent=self.transparent,
-                )
-                if artist_bio is not None:
-                    _msg: str = (
-                        f"Writing artist bio for artist {a.id} to "
-                        f"'{track_artist_bio_json.absolute()}"
-                    )
-                    logger.info(_msg)
-                    track_artist_bio_json.write_text(artist_bio.to_json())
+                tasks.append((self.save_artist_bio, a))
+
+        def save_artist_asset(task: tuple[Callable[[Session, Artist], None], Artist]):
+            save, artist = task
+            with suppress(Exception):
+                save(session, artist)
+
+        map_concurrently(save_artist_asset, tasks, ARTIST_ASSET_CONCURRENCY)
 
     def save_album_cover(self, session: Session):
         """Save cover.jpg to self.album_dir.
@@ -371,26 +465,54 @@ class Track:
         if content_length == 0:
             return None
 
-        range_headers: Iterable[str] = http_request_range_headers(
-            content_length=content_length,
-            range_size=range_size,
-            return_tuple=False,
-        )
-
         with temporary_file(suffix=".mp4") as ntf:
-            for rh in range_headers:
+            # The ranges are requested over several connections at once, and
+            # each is written at its own offset in ntf as soon as it arrives
+            write_lock: threading.Lock = threading.Lock()
+
+            def download_range(byte_range: tuple[int, int]) -> bool:
+                rh: str = f"bytes={byte_range[0]}-{byte_range[1]}"
                 with session.get(
                     self.urls[0],
                     params=self.download_params,
                     headers={"Range": rh},
+                    stream=True,
                 ) as rr:
-                    if not rr.ok:
+                    # Anything but 206 Partial Content, e.g. a 200 from a server
+                    # ignoring the Range header, is not this range's bytes
+                    if rr.status_code != 206:
+                        return False
+                    # Read the body before taking the lock, so that only the
+                    # writes to ntf, not the downloads, are serialized
+                    body: bytes = rr.content
+                with write_lock:
+                    ntf.seek(byte_range[0])
+                    ntf.write(body)
+                logger.debug(
+                    "Wrote %s of track %s to '%s'", rh, self.track_id, ntf.name
+                )
+                return True
+
+            if not all(
+                map_concurrently(
+                    download_range,
+                    contiguous_ranges(content_length, range_size),
+                    RANGE_REQUEST_CONCURRENCY,
+                )
+            ):
+                # Fall back to requesting the whole URL at once
+                ntf.seek(0)
+                ntf.truncate()
+                with session.get(
+                    self.urls[0], params=self.download_params, stream=True
+                ) as resp:
+                    if not resp.ok:
                         _msg: str = f"Could not download {self}"
                         logger.warning(_msg)
                         return None
-                    ntf.write(rr.content)
-                    _msg: str = f"Wrote {rh} of track {self.track_id} to '{ntf.name}'"
-                    logger.debug(_msg)
+                    resp.raw.decode_content = True
+                    shutil.copyfileobj(resp.raw, ntf, length=DOWNLOAD_CHUNK_SIZE)
+            ntf.flush()
             ntf.seek(0)
             _msg: str = f"Finished writing track {self.track_id} to '{ntf.name}'"
             logger.debug(_msg)
@@ -411,29 +533,22 @@ class Track:
                 # decrypt and write to new temporary file
                 with temporary_file(suffix=".mp4") as f_decrypted:
                     # I hope that it doesn't come back to bite me, reading the bytes
-                    # from a file with an open 'wb' file descriptor context manager
-                    audio_bytes: bytes = decryptor.decrypt(Path(ntf.name).read_bytes())
-                    f_decrypted.write(audio_bytes)
+                    # from a file with an open 'wb' file descriptor context manager.
+                    # AES-CTR is a stream cipher, so decrypt a chunk at a time rather
+                    # than holding the whole track in memory twice over
+                    with Path(ntf.name).open("rb") as f_encrypted:
+                        while chunk := f_encrypted.read(DOWNLOAD_CHUNK_SIZE):
+                            f_decrypted.write(decryptor.decrypt(chunk))
+                    f_decrypted.flush()
                     _msg: str = (
                         f"Audio data for track {self.track_id} has been decrypted."
                     )
                     logger.info(_msg)
 
                     if self.codec == "flac":
-                        # Have to use FFMPEG to re-mux the audio bytes, otherwise
-                        # mutagen chokes on NoFlacHeaderError
-                        _msg: str = (
-                            f"Using FFmpeg to remux '{f_decrypted.name}', "
-                            f"writing to '{self.absolute_outfile}'"
-                        )
-                        logger.debug(_msg)
-                        ffmpeg.input(f_decrypted.name, hide_banner=None, y=None).output(
-                            self.absolute_outfile,
-                            acodec="copy",
-                            loglevel="quiet",
-                        ).run()
+                        self.write_flac(f_decrypted.name)
                     elif self.codec == "m4a":
-                        shutil.copyfile(f_decrypted.name, self.outfile)
+                        link_or_copy(f_decrypted.name, self.outfile)
 
                     _msg: str = (
                         f"Track {self.track_id} written to '{self.absolute_outfile}'"
@@ -442,26 +557,40 @@ class Track:
                     return self.outfile
             else:
                 if self.codec == "flac":
-                    # Have to use FFMPEG to re-mux the audio bytes, otherwise
-                    # mutagen chokes on NoFlacHeaderError
-                    _msg: str = (
-                        f"Using FFmpeg to remux '{ntf.name}', "
-                        f"writing to '{self.absolute_outfile}'"
-                    )
-                    logger.debug(_msg)
-                    ffmpeg.input(ntf.name, hide_banner=None, y=None).output(
-                        self.absolute_outfile,
-                        acodec="copy",
-                        loglevel="quiet",
-                    ).run()
+                    self.write_flac(ntf.name)
                 elif self.codec == "m4a":
-                    shutil.copyfile(ntf.name, self.outfile)
+                    link_or_copy(ntf.name, self.outfile)
                 _msg: str = (
-                    f"Track {self.track_id} written to '{self.outfile.absolute()}'"
+                    f"Track {self.track_id} written to '{self.absolute_outfile}'"
                 )
                 logger.info(_msg)
                 return self.outfile
 
+    def write_flac(self, src: str) -> None:
+        """Write the FLAC audio in the file `src` to self.absolute_outfile.
+
+        If `src` is already a native FLAC stream, i.e. it starts with the
+        'fLaC' marker, it is simply linked or copied. Otherwise, e.g. FLAC in
+        an MP4 container, FFmpeg has to re-mux the audio bytes, or else
+        mutagen chokes on NoFlacHeaderError.
+        """
+        with Path(src).open("rb") as f:
+            is_native_flac: bool = f.read(4) == b"fLaC"
+
+        if is_native_flac:
+            link_or_copy(src, self.absolute_outfile)
+            return
+
+        _msg: str = (
+            f"Using FFmpeg to remux '{src}', writing to '{self.absolute_outfile}'"
+        )
+        logger.debug(_msg)
+        ffmpeg.input(src, hide_banner=None, y=None).output(
+            self.absolute_outfile,
+            acodec="copy",
+            loglevel="quiet",
+        ).run()
+
     def download_urls(self, session: Session) -> Path | None:
         """Write the contents from self.urls to a temporary directory.
 
@@ -470,22 +599,62 @@ class Track:
         _msg: str = f"Writing track {self.track_id} to '{self.absolute_outfile}'"
         logger.info(_msg)
 
-        with temporary_file(suffix=".mp4") as ntf:
-            for i, u in enumerate(self.urls, 1):
-                _url: str = u.split("?")[0]
-                _msg: str = (
-                    f"Requesting part {i} of track {self.track_id} "
-                    f"from '{_url}', writing to '{ntf.name}'"
+        def download_segment(i_u: tuple[int, str]) -> SpooledTemporaryFile | None:
+            """GET the i-th segment of the track, streaming it into a spooled
+            buffer; returns None upon error."""
+            i, u = i_u
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Requesting part %d of track %s from '%s'",
+                    i,
+                    self.track_id,
+                    u.split("?")[0],
                 )
-                logger.debug(_msg)
-                with session.get(
-                    url=u, headers=self.download_headers, params=self.download_params
-                ) as resp:
-                    if not resp.ok:
-                        _msg: str = f"Could not download {self}"
-                        logger.warning(_msg)
-                        return None
-                    ntf.write(resp.content)
+            with session.get(
+                url=u,
+                headers=self.download_headers,
+                params=self.download_params,
+                stream=True,
+            ) as resp:
+                if not resp.ok:
+                    return None
+                resp.raw.decode_content = True
+                buffer = SpooledTemporaryFile(max_size=DOWNLOAD_CHUNK_SIZE)
+                try:
+                    shutil.copyfileobj(resp.raw, buffer, length=DOWNLOAD_CHUNK_SIZE)
+                except BaseException:
+                    buffer.close()
+                    raise
+            buffer.seek(0)
+            return buffer
+
+        with temporary_file(suffix=".mp4") as ntf, ThreadPoolExecutor(
+            max_workers=SEGMENT_CONCURRENCY
+        ) as executor:
+            # Keep up to SEGMENT_CONCURRENCY segments in flight: as soon as the
+            # oldest one is written to ntf, in manifest order, request the next
+            segments = enumerate(self.urls, 1)
+            window: deque[Future] = deque(
+                executor.submit(download_segment, s)
+                for s in islice(segments, SEGMENT_CONCURRENCY)
+            )
+            while window:
+                try:
+                    segment: SpooledTemporaryFile | None = window.popleft().result()
+                except Exception as e:
+                    logger.debug(e)
+                    segment = None
+                if segment is None:
+                    # Segments already requested are not leaked: close them
+                    cancel_and_close(window)
+                    _msg: str = f"Could not download {self}"
+                    logger.warning(_msg)
+                    return None
+                with segment:
+                    shutil.copyfileobj(segment, ntf, length=DOWNLOAD_CHUNK_SIZE)
+                for s in islice(segments, 1):
+                    window.append(executor.submit(download_segment, s))
+            ntf.flush()
             ntf.seek(0)
 
             if (self.manifest.key is not None) and (self.manifest.nonce is not None):
@@ -503,29 +672,22 @@ class Track:
                 # decrypt and write to new temporary file
                 with temporary_file(suffix=".mp4") as f_decrypted:
                     # I hope that it doesn't come back to bite me, reading the bytes
-                    # from a file with an open 'wb' file descriptor context manager
-                    audio_bytes: bytes = decryptor.decrypt(Path(ntf.name).read_bytes())
-                    f_decrypted.write(audio_bytes)
+                    # from a file with an open 'wb' file descriptor context manager.
+                    # AES-CTR is a stream cipher, so decrypt a chunk at a time rather
+                    # than holding the whole track in memory twice over
+                    with Path(ntf.name).open("rb") as f_encrypted:
+                        while chunk := f_encrypted.read(DOWNLOAD_CHUNK_SIZE):
+                            f_decrypted.write(decryptor.decrypt(chunk))
+                    f_decrypted.flush()
                     _msg: str = (
                         f"Audio data for track {self.track_id} has been decrypted."
                     )
                     logger.info(_msg)
 
                     if self.codec == "flac":
-                        # Have to use FFMPEG to re-mux the audio bytes, otherwise
-                        # mutagen chokes on NoFlacHeaderError
-                        _msg: str = (
-                            f"Using FFmpeg to remux '{f_decrypted.name}', "
-                            f"writing to '{self.absolute_outfile}'"
-                        )
-                        logger.debug(_msg)
-                        ffmpeg.input(f_decrypted.name, hide_banner=None, y=None).output(
-                            self.absolute_outfile,
-                            acodec="copy",
-                            loglevel="quiet",
-                        ).run()
+                        self.write_flac(f_decrypted.name)
                     elif self.codec == "m4a":
-                        shutil.copyfile(f_decrypted.name, self.outfile)
+                        link_or_copy(f_decrypted.name, self.outfile)
 
                     _msg: str = (
                         f"Track {self.track_id} written to '{self.absolute_outfile}'"
@@ -534,18 +696,9 @@ class Track:
                     return self.outfile
             else:
                 if self.codec == "flac":
-                    # Have to use FFmpeg to re-mux the audio bytes, otherwise
-                    # mutagen chokes on NoFlacHeaderError
-                    _msg: str = (
-                        f"Using FFmpeg to remux '{ntf.name}', "
-                        f"writing to '{self.absolute_outfile}'"
-                    )
-                    logger.info(_msg)
-                    ffmpeg.input(ntf.name, hide_banner=None, y=None).output(
-                        self.absolute_outfile, acodec="copy", loglevel="quiet"
-                    ).run()
+                    self.write_flac(ntf.name)
                 elif self.codec == "m4a":
-                    shutil.copyfile(ntf.name, self.outfile)
+                    link_or_copy(ntf.name, self.outfile)
 
                 _msg: str = (
                     f"Track {self.track_id} written to '{self.absolute_outfile}'"
@@ -568,46 +721,37 @@ class Track:
     def craft_tags(self):
         """Populate the attribute self.tags.
 
-        Using the TAG_MAPPING dictionary, add the correct values
+        Using the tag mapping for self.codec, add the correct values
         of various metadata tags to the self.tags dict.
         E.g. for .flac files, the album's artist is 'ALBUMARTIST',
         but for .m4a files, the album's artist is 'aART'.
         """
         tags: dict[str, str | float | list[str] | int] = {}
-        if self.codec == "flac":
-            tag_map = {k: v["flac"] for k, v in TAG_MAPPING.items()}
-        elif self.codec == "m4a":
-            tag_map = {k: v["m4a"] for k, v in TAG_MAPPING.items()}
-
-        tags[tag_map["album"]] = self.album.title
-        tags[tag_map["album_artist"]] = ";".join(a.name for a in self.album.artists)
-        tags[tag_map["album_peak_amplitude"]] = (
-            f"{self.stream.album_peak_amplitude}"
-            if self.stream.album_peak_amplitude is not None
-            else None
-        )
-        tags[tag_map["album_replay_gain"]] = (
-            f"{self.stream.album_replay_gain} dB"
-            if self.stream.album_replay_gain is not None
-            else None
-        )
-        tags[tag_map["artist"]] = ";".join(a.name for a in self.metadata.artists)
-        tags[tag_map["artists"]] = [a.name for a in self.metadata.artists]
-        tags[tag_map["barcode"]] = self.album.upc
-        tags[tag_map["copyright"]] = self.metadata.copyright
-        tags[tag_map["date"]] = str(self.album.release_date)
-        tags[tag_map["isrc"]] = self.metadata.isrc
-        tags[tag_map["media"]] = "Digital Media"
-        tags[tag_map["title"]] = self.metadata.title
-        tags[tag_map["track_peak_amplitude"]] = f"{self.metadata.peak}"
-        tags[tag_map["track_peak_amplitude"]] = (
-            f"{self.metadata.peak}" if self.metadata.peak is not None else None
-        )
-        tags[tag_map["track_replay_gain"]] = (
-            f"{self.metadata.replay_gain} dB"
-            if self.metadata.replay_gain is not None
-            else None
-        )
+        tag_map: Mapping[str, str] = get_tag_map(self.codec)
+
+        def put(tag: str, value: str | float | list[str] | int | None) -> None:
+            """Add `value` to tags under the mapped name of `tag`, unless None."""
+            if value is not None:
+                tags[tag_map[tag]] = value
+
+        put("album", self.album.title)
+        put("album_artist", ";".join(a.name for a in self.album.artists))
+        if self.stream.album_peak_amplitude is not None:
+            put("album_peak_amplitude", f"{self.stream.album_peak_amplitude}")
+        if self.stream.album_replay_gain is not None:
+            put("album_replay_gain", f"{self.stream.album_replay_gain} dB")
+        put("artist", ";".join(a.name for a in self.metadata.artists))
+        put("artists", [a.name for a in self.metadata.artists])
+        put("barcode", self.album.upc)
+        put("copyright", self.metadata.copyright)
+        put("date", str(self.album.release_date))
+        put("isrc", self.metadata.isrc)
+        put("media", "Digital Media")
+        put("title", self.metadata.title)
+        if self.metadata.peak is not None:
+            put("track_peak_amplitude", f"{self.metadata.peak}")
+        if self.metadata.replay_gain is not None:
+            put("track_replay_gain", f"{self.metadata.replay_gain} dB")
         # credits
         for tag in ("composer", "engineer", "lyricist", "mixer", "producer", "remixer"):
             try:
@@ -615,17 +759,17 @@ class Track:
             except (TypeError, AttributeError):  # NoneType problems
                 continue
             else:
-                tags[tag_map[tag]] = _credits_tag
+                put(tag, _credits_tag)
         # lyrics
         try:
             _lyrics = self.lyrics.subtitles
         except (TypeError, AttributeError):  # NoneType problems
             pass
         else:
-            tags[tag_map["lyrics"]] = _lyrics
+            put("lyrics", _lyrics)
 
         if self.codec == "flac":
-            tags[tag_map["comment"]] = self.metadata.url
+            put("comment", self.metadata.url)
             # track and disk
             tags["DISCTOTAL"] = f"{self.album.number_of_volumes}"
             tags["DISC"] = f"{self.metadata.volume_number}"
@@ -643,7 +787,8 @@ class Track:
                 tags["PERFORMER"] = piano_credits
 
         elif self.codec == "m4a":
-            tags["\xa9url"] = self.metadata.url
+            if self.metadata.url is not None:
+                tags["\xa9url"] = self.metadata.url
             # Whether explicit field, 'rtng', does not have a FLAC counterpart
             if self.metadata.explicit is None:
                 tags["rtng"] = (0,)
@@ -656,17 +801,17 @@ class Track:
             tags["stik"] = (1,)  # Music (https://exiftool.org/TagNames/QuickTime.html)
 
             # Have to convert to bytes the values of the tags starting with '----'
-            for k, v in tags.copy().items():
-                if k.startswith("----"):
-                    if isinstance(v, str):
-                        tags[k] = v.encode("UTF-8")
-                    elif isinstance(v, list):
-                        tags[k] = [s.encode("UTF-8") for s in v]
+            for k in FREEFORM_TAGS_M4A.intersection(tags):
+                v = tags[k]
+                if isinstance(v, str):
+                    tags[k] = v.encode("UTF-8")
+                elif isinstance(v, list):
+                    tags[k] = [s.encode("UTF-8") for s in v]
 
             tags["trkn"] = [(self.metadata.track_number, self.album.number_of_tracks)]
             tags["disk"] = [(self.metadata.volume_number, self.album.number_of_volumes)]
 
-        self.tags: dict = {k: v for k, v in tags.items() if v is not None}
+        self.tags: dict = tags
 
     def set_mutagen(self):
         """Create self.mutagen, mutagen.File object, pointing to self.outfile."""
@@ -682,18 +827,23 @@ class Track:
         .flac files. It has been split out from self.set_tags so that it
         can be executed BEFORE self.remux(): otherwise, the .m4a
         metadata tags starting with '----com.apple.iTunes:' are lost.
+        The image is self.cover_bytes if set, else the contents of
+        self.cover_path.
         """
+        if self.cover_bytes is None:
+            self.cover_bytes = self.cover_path.read_bytes()
+
         if self.codec == "flac":
             p = mutagen.flac.Picture()
             p.type = mutagen.id3.PictureType.COVER_FRONT
             p.desc = "Album Cover"
             p.width = p.height = dimension
             p.mime = "image/jpeg"
-            p.data = self.cover_path.read_bytes()
+            p.data = self.cover_bytes
             self.mutagen.add_picture(p)
         elif self.codec == "m4a":
             self.mutagen["covr"] = [
-                MP4Cover(self.cover_path.read_bytes(), imageformat=MP4Cover.FORMAT_JPEG)
+                MP4Cover(self.cover_bytes, imageformat=MP4Cover.FORMAT_JPEG)
             ]
 
         self.mutagen.save()
@@ -743,7 +893,7 @@ class Track:
                 with temporary_file(suffix=".mp4") as tf:
                     cmd: str | None = shlex.split(_cmd % tf.name)
                     subprocess.run(cmd, check=True)
-                    shutil.copyfile(tf.name, self.absolute_outfile)
+                    link_or_copy(tf.name, self.absolute_outfile)
 
     def get(
         self,
@@ -754,6 +904,7 @@ class Track:
         album: AlbumsEndpointResponseJSON | None = None,
         no_extra_files: bool = True,
         origin_jpg: bool = True,
+        cover_bytes: bytes | None = None,
     ) -> str | None:
         """Execute several instance methods in sequence, returning path to audio file.
 
@@ -763,20 +914,24 @@ class Track:
           3) self.set_album_dir(out_dir)
           4) self.set_credits(session)
           5) self.set_stream(session, audio_format)
-          6) self.save_artist_image(session)
-          7) self.save_artist_bio(session)
-          8) self.get_lyrics(session)
-          9) self.set_urls(session)
-          10) self.download(session, out_dir)
-          11) self.set_mutagen()
-          12) self.set_cover_image_tag()
-          13) self.remux()
-          14) self.craft_tags()
-          15) self.set_tags()
-          16) self.original_album_cover(session);
-
-        catching Exceptions and attempting to handle edge cases.
+          6) self.get_lyrics(session) and self.save_artist_assets(session),
+             concurrently with 7) and 8)
+          7) self.set_urls(session)
+          8) self.download(session, out_dir)
+          9) self.set_mutagen()
+          10) self.set_cover_image_tag()
+          11) self.remux()
+          12) self.craft_tags()
+          13) self.set_tags()
+          14) self.original_album_cover(session);
+
+        catching Exceptions and attempting to handle edge cases. If the
+        album's cover image has already been read, e.g. by album.Album,
+        passing it as `cover_bytes` skips cover.jpg in self.album_dir.
         """
+        # Accept the plain string value, too, so that audio_format can be
+        # compared by identity from here on
+        audio_format = AudioFormat(audio_format)
         if metadata is None:
             self.set_metadata(session)
         else:
@@ -790,7 +945,7 @@ class Track:
         # available in Dolby Atmos format as well as HI_RES, e.g.
         if (
             "DOLBY_ATMOS" in self.metadata.media_metadata.tags
-            and audio_format != AudioFormat.dolby_atmos
+            and audio_format is not AudioFormat.dolby_atmos
         ):
             _msg: str = (
                 f"Track {self.track_id} is only available in Dolby Atmos "
@@ -800,7 +955,7 @@ class Track:
             self.outfile = None
             return None
 
-        if (audio_format == AudioFormat.dolby_atmos) and (
+        if (audio_format is AudioFormat.dolby_atmos) and (
             "DOLBY_ATMOS" not in self.metadata.media_metadata.tags
         ):
             _msg: str = (
@@ -822,6 +977,17 @@ class Track:
             return None
         self.set_album_dir(out_dir)
 
+        # Short of HiRes, the codec, hence the file name, of each audio format
+        # is known in advance: if that file already exists, skip the requests
+        # for credits, stream, and manifest altogether
+        self.codec = AF_CODEC.get(audio_format)
+        if self.codec is not None:
+            self.set_filename(audio_format)
+            if self.set_outfile() is None:
+                if not no_extra_files:
+                    self.save_artist_assets(session)
+                return None
+
         self.set_credits(session)
         self.set_stream(session, audio_format)
         if self.stream is None:
@@ -833,7 +999,8 @@ class Track:
             self.outfile = None
             return None
 
-        self.set_filename(audio_format)
+        self.set_effective_format(audio_format)
+        self.set_filename(self.effective_format)
         if self.filename is None:
             self.outfile = None
             return None
@@ -841,17 +1008,25 @@ class Track:
         outfile: Path | None = self.set_outfile()
         if outfile is None:
             if not no_extra_files:
-                with suppress(Exception):
-                    self.save_artist_image(session)
-                    self.save_artist_bio(session)
+                self.save_artist_assets(session)
             return None
 
-        with suppress(Exception):
-            self.get_lyrics(session)
+        # Lyrics, and the artists' images and bios, don't depend on the audio
+        # data: so, request them while the track downloads. As before, a
+        # failure to retrieve any of them is ignored
+        side_fetches: list[Callable[[Session], object]] = [self.get_lyrics]
+        if not no_extra_files:
+            side_fetches.append(self.save_artist_assets)
 
-        self.set_urls(session)
+        with ThreadPoolExecutor(max_workers=len(side_fetches)) as executor:
+            futures: list[Future] = [executor.submit(f, session) for f in side_fetches]
+            self.set_urls(session)
+            outfile = self.download(session, out_dir)
+            for future in futures:
+                with suppress(Exception):
+                    future.result()
 
-        if self.download(session, out_dir) is None:
+        if outfile is None:
             return None
 
         self.set_mutagen()
@@ -861,25 +1036,25 @@ class Track:
                 f"No cover image was returned from TIDAL API for album {self.album.id}"
             )
             logger.warning(_msg)
+        elif cover_bytes is not None:
+            self.cover_bytes = cover_bytes
+            self.set_cover_image_tag()
         else:
-            self.save_album_cover(session)
-            if self.cover_path.exists() and self.cover_path.stat().st_size > 0:
-                self.set_cover_image_tag()
+            with _cover_lock(self.cover_path):
+                self.save_album_cover(session)
+                if self.cover_path.exists() and self.cover_path.stat().st_size > 0:
+                    self.set_cover_image_tag()
 
         self.remux()
         self.craft_tags()
         self.set_tags()
 
         if not no_extra_files:
-            with suppress(Exception):
-                self.save_artist_image(session)
-                self.save_artist_bio(session)
-
             if origin_jpg:
                 with suppress(Exception):
                     self.original_album_cover(session)
         else:
-            with suppress(FileNotFoundError):
+            with _cover_lock(self.cover_path), suppress(FileNotFoundError):
                 self.cover_path.unlink()
 
         return self.absolute_outfile
@@ -894,7 +1069,7 @@ class Track:
             v: str | None = None
         else:
             v: str | None = self.absolute_outfile
-        json.dump({k: v}, fp)
+        fp.write(orjson.dumps({k: v}, option=orjson.OPT_NON_STR_KEYS).decode())
 
     def dumps(self) -> str | None:
         """Return a str version of self.
@@ -908,5 +1083,4 @@ class Track:
             v: str | None = None
         else:
             v: str | None = self.absolute_outfile
-        json.dumps({k: v})
-        return None
+        return orjson.dumps({k: v}, option=orjson.OPT_NON_STR_KEYS).decode()
@@ -3,21 +3,32 @@
 import base64
 import logging
 import os
+import shutil
 import socket
 import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import closing, contextmanager
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from Crypto.Cipher import AES
 from requests import Session
 
 TIDAL_API_URL: str = "https://api.tidal.com/v1"
 IMAGE_URL: str = "https://resources.tidal.com/images/%s.jpg"
+# Buffer size for streaming media responses to disk, keeping memory use
+# flat no matter how large a track or video is
+DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024  # 1 MiB
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 def replace_illegal_characters(input_str: str) -> str:
     """Some characters are illegal for use as file names on Windows
@@ -77,6 +88,113 @@ def download_cover_image(
         return output_file
 
 
+def map_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = 1,
+    delay_ms: int = 0,
+) -> List[R]:
+    """Call `fn` on each of `items` in at most `concurrency` threads, and
+    return the results in the order of `items`. If `delay_ms` is positive,
+    wait that many milliseconds between submitting one item and the next,
+    so as not to provoke HTTP 429 responses from TIDAL. The first exception
+    raised by `fn`, in the order of `items`, is re-raised."""
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = []
+        for i, item in enumerate(items):
+            if i > 0 and delay_ms > 0:
+                time.sleep(delay_ms / 1000)
+            futures.append(executor.submit(fn, item))
+        return [f.result() for f in futures]
+
+
+def cancel_and_close(futures: Iterable[Future]) -> None:
+    """Cancel each of `futures` that has not started running; wait for the
+    rest, closing any file object that they returned."""
+    running: List[Future] = [f for f in futures if not f.cancel()]
+    for f in running:
+        try:
+            result = f.result()
+        except Exception:
+            continue
+        if result is not None:
+            result.close()
+
+
+def link_or_copy(src: str, dst: Union[str, Path]) -> None:
+    """Hard link the file `src` to `dst`, which is O(1) when both are on the
+    same filesystem. Otherwise, e.g. if the temporary directory is on a
+    different drive, or if `dst` already exists, fall back to copying."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def is_artist_file(entry: os.DirEntry) -> bool:
+    """Whether the directory entry `entry` is an artist image, i.e. a JPEG
+    other than cover.jpg, or an artist bio JSON file."""
+    if not entry.is_file():
+        return False
+    name: str = entry.name
+    return (name.endswith(".jpg") and name != "cover.jpg") or name.endswith(
+        "bio.json"
+    )
+
+
+def move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Move the file `src` to `dst`, replacing `dst` if it exists. This is a
+    rename if both are on the same filesystem, else a copy then delete."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
+class RateLimiter:
+    """A token bucket shared by all threads: on average, at most `rate`
+    calls to acquire() return per second, after an initial burst of up
+    to `capacity` calls. A `rate` of 0 disables the limit."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self._lock = threading.Lock()
+        self.configure(rate, capacity)
+
+    def configure(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Set a new `rate` and `capacity`, starting with a full bucket. By
+        default, `capacity` is one second's worth of calls."""
+        with self._lock:
+            self.rate: float = rate
+            self.capacity: float = (
+                capacity if capacity is not None else max(rate, 1.0)
+            )
+            self._tokens: float = self.capacity
+            self._updated: float = time.monotonic()
+
+    def acquire(self) -> None:
+        """Take a token from the bucket, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve the token even if it has not accrued yet, so that
+            # waiting threads are served in the order they arrived
+            self._tokens -= 1
+            wait: float = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Every request to TIDAL API, from whichever thread, goes through this
+# limiter, so that concurrent downloads don't provoke HTTP 429 responses
+TIDAL_API_REQUESTS_PER_SECOND: float = 10.0
+api_rate_limiter: RateLimiter = RateLimiter(rate=TIDAL_API_REQUESTS_PER_SECOND)
+
+
 @contextmanager
 def temporary_file(suffix: str = ".mka"):
     """This context-managed function is a stand-in for
@@ -123,13 +241,17 @@ def decrypt_manifest_key_id(manifest_key_id: str) -> Tuple[bytes, bytes]:
     return key, nonce
 
 
+@lru_cache(maxsize=1)
 def is_tidal_api_reachable(hostname: str = "api.tidal.com") -> bool:
     """Using stdlib 'socket' library, test if a few conditions are all
     met: whether the user has a connection to the larger Internet;
     whether the user can resolve the primary URL for this service,
-    api.tidal.com, and whether api.tidal.com is responding to requests"""
+    api.tidal.com, and whether api.tidal.com is responding to requests.
+    The probing socket is closed straight away: the connection that is
+    reused later is the one login() opens to /sessions with the Session."""
     try:
-        _ = closing(socket.create_connection((hostname, 80)))
+        with closing(socket.create_connection((hostname, 80), timeout=10)):
+            pass
     except ConnectionRefusedError:
         logger.critical("It seems that 'api.tidal.com' is unreachable!")
         return False
@@ -141,7 +263,7 @@ def is_tidal_api_reachable(hostname: str = "api.tidal.com") -> bool:
         )
         return False
     except OSError as ose:
-        if "[Errno 101] Network is unreachable" in ose.msg:
+        if "[Errno 101] Network is unreachable" in str(ose):
             logger.critical(
                 "tidal-wave appears to be unable to reach the Internet. "
                 "Please ensure that connectivity to (at least) api.tidal.com "
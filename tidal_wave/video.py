@@ -1,31 +1,41 @@
 """Represent a video in the reckoning of TIDAL API."""
 
-import json
 import logging
+import shutil
 import sys
 import urllib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple
 
 import ffmpeg
 import m3u8
-import mutagen
+import orjson
+from mutagen.mp4 import MP4
 from requests import Session
 
 from .hls import TidalM3U8Error, playlister, variant_streams
-from .media import TAG_MAPPING
+from .media import FREEFORM_TAGS_M4A, TAG_MAPPING_M4A
 from .models import (
     VideosContributorsResponseJSON,
     VideosEndpointResponseJSON,
     VideosEndpointStreamResponseJSON,
 )
 from .requesting import request_video_contributors, request_video_stream, request_videos
-from .utils import temporary_file
+from .utils import DOWNLOAD_CHUNK_SIZE, cancel_and_close
 
 logger = logging.getLogger("__name__")
 
+# How many HLS segments of a video are requested at the same time. Each is held
+# in memory up to DOWNLOAD_CHUNK_SIZE bytes, beyond which it spills to disk
+SEGMENT_CONCURRENCY: int = 6
+
 
 class VideoFormat(str, Enum):
     high = "HIGH"
@@ -124,8 +134,9 @@ class Video:
 
     def download(self, session: Session, out_dir: Path) -> Optional[Path]:
         """Requests the HLS video files that constitute self.urls.
-        Writes HLS bytes to a temporary file, then uses FFmpeg to write the
-        video data to self.outfile"""
+        Streams HLS bytes to FFmpeg, which writes the video data to
+        self.outfile; if FFmpeg fails, the HLS bytes are requested again and
+        written to self.outfile as they are"""
         download_params: Dict[str, None] = {k: None for k in session.params}
         # self.outfile should already have been set by self.set_outfile()
         request_headers: Dict[str, str] = (
@@ -133,53 +144,140 @@ class Video:
             if session.session_id is not None
             else {}
         )
-        logger.info(
-            f"Writing video {self.video_id} to '{str(self.outfile.absolute())}'"
-        )
+        logger.info(f"Writing video {self.video_id} to '{self.absolute_outfile}'")
 
-        with temporary_file(suffix=".m2t") as tf:
-            for i, u in enumerate(self.urls, 1):
+        def download_segment(i_u: Tuple[int, str]) -> Optional[SpooledTemporaryFile]:
+            """GET the i-th segment of the video, streaming it into a spooled
+            buffer; returns None upon error."""
+            i, u = i_u
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"\tRequesting part {i} of video {self.video_id}: {u.split('?')[0]}"
+                    "\tRequesting part %d of video %s: %s",
+                    i,
+                    self.video_id,
+                    u.split("?")[0],
                 )
-                with session.get(
-                    url=u, headers=request_headers, params=download_params
-                ) as download_response:
-                    if not download_response.ok:
-                        logger.warning(f"Could not download {self}")
-                        return None
-                    tf.write(download_response.content)
-            tf.seek(0)
-            self.outfile.write_bytes(Path(tf.name).read_bytes())
-
-            if self.outfile.exists() and self.outfile.stat().st_size > 0:
-                logger.info(
-                    f"Video {self.video_id} written to '{self.absolute_outfile}'"
+            with session.get(
+                url=u, headers=request_headers, params=download_params, stream=True
+            ) as download_response:
+                if not download_response.ok:
+                    return None
+                download_response.raw.decode_content = True
+                buffer = SpooledTemporaryFile(max_size=DOWNLOAD_CHUNK_SIZE)
+                try:
+                    shutil.copyfileobj(
+                        download_response.raw, buffer, length=DOWNLOAD_CHUNK_SIZE
+                    )
+                except BaseException:
+                    buffer.close()
+                    raise
+            buffer.seek(0)
+            return buffer
+
+        def write_segments(fp: BinaryIO) -> bool:
+            """Request the segments in self.urls, keeping up to
+            SEGMENT_CONCURRENCY requests in flight, and write them to `fp` in
+            playlist order. Return False if a segment could not be downloaded.
+            """
+            with ThreadPoolExecutor(max_workers=SEGMENT_CONCURRENCY) as executor:
+                segments: Iterator[Tuple[int, str]] = enumerate(self.urls, 1)
+                window: Deque[Future] = deque(
+                    executor.submit(download_segment, s)
+                    for s in islice(segments, SEGMENT_CONCURRENCY)
                 )
+                try:
+                    while window:
+                        try:
+                            segment: Optional[SpooledTemporaryFile] = (
+                                window.popleft().result()
+                            )
+                        except Exception as e:
+                            logger.debug(e)
+                            segment = None
+                        if segment is None:
+                            logger.warning(f"Could not download {self}")
+                            return False
+                        with segment:
+                            shutil.copyfileobj(segment, fp, length=DOWNLOAD_CHUNK_SIZE)
+                        # As soon as the oldest segment is written, request
+                        # the next
+                        for s in islice(segments, 1):
+                            window.append(executor.submit(download_segment, s))
+                finally:
+                    # Do not request any more segments once this has stopped,
+                    # and close those that were already requested
+                    cancel_and_close(window)
+            return True
+
+        # FFmpeg remuxes the MPEG-TS data as it arrives on its stdin, so that
+        # remuxing overlaps downloading, and no copy of the data is kept
+        process = (
+            ffmpeg.input("pipe:", format="mpegts", hide_banner=None, y=None)
+            .output(
+                self.absolute_outfile,
+                vcodec="copy",
+                acodec="copy",
+                loglevel="quiet",
+                **{"movflags": "+faststart"},
+            )
+            .run_async(pipe_stdin=True)
+        )
+        broken_pipe: bool = False
+        completed: bool = False
 
+        try:
             try:
-                ffmpeg.input(tf.name, hide_banner=None, y=None).output(
-                    self.absolute_outfile,
-                    vcodec="copy",
-                    acodec="copy",
-                    loglevel="quiet",
-                    **{"movflags": "+faststart"},
-                ).run()
-            except ffmpeg.Error:
-                logger.warning(
-                    f"Could not convert video {self.video_id} with FFmpeg: "
-                    "metadata will not be added and format will stay as MPEG-TS"
-                )
+                if not write_segments(process.stdin):
+                    return None
+            except BrokenPipeError:
+                # FFmpeg exited before reading all of the data
+                broken_pipe = True
+            with suppress(BrokenPipeError):
+                process.stdin.close()
+            remuxed: bool = (process.wait() == 0) and (not broken_pipe)
+            completed = True
+        finally:
+            # Whether a segment could not be downloaded, or an exception
+            # (including KeyboardInterrupt) arose, do not leave FFmpeg
+            # running nor a truncated self.outfile that would later be
+            # mistaken for a finished download
+            if not completed:
+                process.kill()
+                process.wait()
+                with suppress(OSError):
+                    process.stdin.close()
+                self.outfile.unlink(missing_ok=True)
+
+        if not remuxed:
+            logger.warning(
+                f"Could not convert video {self.video_id} with FFmpeg: "
+                "metadata will not be added and format will stay as MPEG-TS"
+            )
+            # Rather than keeping a second copy of every video's data on disk
+            # for this rare case, request the segments again, writing them to
+            # self.outfile as they are
+            written: bool = False
+            try:
+                with self.outfile.open("wb") as fp:
+                    written = write_segments(fp)
+            finally:
+                if not written:
+                    self.outfile.unlink(missing_ok=True)
+            if not written:
+                return None
+
+        if self.outfile.exists() and self.outfile.stat().st_size > 0:
+            logger.info(f"Video {self.video_id} written to '{self.absolute_outfile}'")
 
         return self.outfile
 
     def craft_tags(self):
-        """Using the TAG_MAPPING dictionary, write the correct values of
+        """Using the TAG_MAPPING_M4A mapping, write the correct values of
         various metadata tags to the file. Videos are AVC1 video, AAC audio in
         MP4 container, so see Kodi reference:
         https://kodi.wiki/view/Video_file_tagging#Overview_and_Comparison"""
         tags = dict()
-        tag_map = {k: v["m4a"] for k, v in TAG_MAPPING.items()}
+        tag_map = TAG_MAPPING_M4A
 
         logger.info(
             f"Adding metadata tags to video {self.video_id} using "
@@ -289,26 +387,26 @@ class Video:
             tags[tag_map["publisher"]] = _credits_tag
 
         # Have to convert to bytes the values of the tags starting with '----'
-        for k, v in tags.copy().items():
-            if k.startswith("----"):
-                if isinstance(v, str):
-                    tags[k] = v.encode("UTF-8")
-                elif isinstance(v, list):
-                    tags[k] = [s.encode("UTF-8") for s in v]
+        for k in FREEFORM_TAGS_M4A.intersection(tags):
+            v = tags[k]
+            if isinstance(v, str):
+                tags[k] = v.encode("UTF-8")
+            elif isinstance(v, list):
+                tags[k] = [s.encode("UTF-8") for s in v]
 
         self.tags: dict = {k: v for k, v in tags.items() if v is not None}
 
     def set_tags(self):
-        """Instantiate a mutagen.File instance, add self.tags to it, and
+        """Instantiate a mutagen.mp4.MP4 instance, add self.tags to it, and
         save it to disk. If video container is still in MPEG-TS format,
-        this is expected to fail"""
+        this is expected to fail. The file has just been written by FFmpeg,
+        so its tags are updated in place rather than cleared first"""
         try:
-            self.mutagen = mutagen.File(self.outfile)
+            self.mutagen = MP4(self.outfile)
         except Exception:
             logger.warning(f"Unable to write metadata tags to {self.video_id}")
             return
 
-        self.mutagen.clear()
         self.mutagen.update(**self.tags)
         self.mutagen.save()
 
@@ -364,10 +462,10 @@ class Video:
         """This method emulates stdlib json.dump(). In particular,
         it sends to 'fp' the JSON-formatted dict
         {self.metadata.title: self.absolute_outfile}"""
-        json.dump({self.metadata.title: self.absolute_outfile}, fp)
+        fp.write(orjson.dumps({self.metadata.title: self.absolute_outfile}).decode())
 
     def dumps(self) -> str:
         """This method emulates stdlib json.dumps(). In particular,
         it returns the JSON-formatted str from the dict
         {self.metadata.title: self.absolute_outfile}"""
-        return json.dumps({self.metadata.title: self.absolute_outfile})
+        return orjson.dumps({self.metadata.title: self.absolute_outfile}).decode()